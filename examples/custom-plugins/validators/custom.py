@@ -9,6 +9,7 @@ Usage in workflow.yaml:
       git_branch: "validators.custom.GitBranchValidator"
       coverage: "validators.custom.CoverageValidator"
       deps_secure: "validators.custom.DependencyValidator"
+      all_of: "validators.custom.BatchValidator"
 
     stages:
       MY_STAGE:
@@ -18,12 +19,49 @@ Usage in workflow.yaml:
               - rule: git_branch
                 args:
                   branch: "main"
+
+Independent, slow checks (pytest, safety, git) can be run concurrently by
+grouping them under a single ``all_of`` condition:
+
+              - rule: all_of
+                args:
+                  validators:
+                    - rule: coverage
+                      args: {minimum: 80}
+                    - rule: deps_secure
+                    - rule: git_branch
+                      args: {branch: "main"}
 """
 
-import subprocess
+import hashlib
+import os
 import re
-import json
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# subprocess.run calls pass close_fds=False: descriptors are already
+# non-inheritable by default (PEP 446), so this only skips the fd-table sweep
+# before exec. start_new_session keeps Ctrl-C in the terminal from reaching
+# the validator's child processes directly.
+
+# subprocess, json, shutil and concurrent.futures are imported inside the
+# methods that need them, so loading this plugin module stays cheap for
+# workflows that never evaluate these rules.
+
+# orjson is optional; it parses large safety reports considerably faster
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# re2 (pyre2) is optional; it matches in linear time, so a user-supplied
+# branch pattern can't trigger catastrophic backtracking
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
 
 # Import the base validator from the workflow package
 # When running from the examples directory, this requires proper PYTHONPATH
@@ -37,13 +75,95 @@ except ImportError:
             raise NotImplementedError
 
 
+# Longer branch patterns are rejected outright
+_MAX_PATTERN_LENGTH = 256
+
+# Raised by _compile for an invalid pattern
+_PATTERN_ERRORS = (re.error, re2.error) if HAS_RE2 else (re.error,)
+
+
+@lru_cache(maxsize=128)
+def _compile(pattern: str) -> "re.Pattern[str]":
+    """Compile a user-supplied regex once and reuse it across validations."""
+    return (re2 if HAS_RE2 else re).compile(pattern)
+
+
+def _read_head_branch(start: str) -> Optional[str]:
+    """
+    Read the branch name from .git/HEAD without forking git.
+
+    Walks up from start to the nearest .git. A .git file (worktree or
+    submodule) is followed through its "gitdir:" line. Returns None when
+    HEAD doesn't name a branch (detached HEAD) or can't be read, so the
+    caller can fall back to the git CLI.
+    """
+    path = os.path.abspath(start)
+    while True:
+        git_dir = os.path.join(path, '.git')
+        if os.path.isdir(git_dir):
+            break
+        if os.path.isfile(git_dir):
+            try:
+                with open(git_dir, 'r', encoding='utf-8') as f:
+                    line = f.readline().strip()
+            except OSError:
+                return None
+            if not line.startswith('gitdir:'):
+                return None
+            # Relative gitdir paths are relative to the directory holding .git
+            git_dir = os.path.join(path, line[len('gitdir:'):].strip())
+            break
+        if os.path.lexists(git_dir):
+            return None
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+    try:
+        with open(os.path.join(git_dir, 'HEAD'), 'r', encoding='utf-8') as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+    prefix = 'ref: refs/heads/'
+    return head[len(prefix):] if head.startswith(prefix) else None
+
+
+def _current_branch() -> Optional[str]:
+    """
+    Return the current git branch, or None if it can't be determined.
+
+    Not cached: reading .git/HEAD is cheap, and a cache could report the
+    old branch right after a checkout.
+    """
+    branch = _read_head_branch(os.getcwd())
+    if branch is not None:
+        return branch
+
+    import subprocess
+    result = subprocess.run(
+        ['git', 'branch', '--show-current'],
+        capture_output=True,
+        text=True,
+        timeout=10,
+        check=False,
+        close_fds=False,
+        start_new_session=True
+    )
+    if result.returncode != 0:
+        return None
+
+    return result.stdout.strip()
+
+
 class GitBranchValidator(BaseValidator):
     """
     Validates that the current Git branch matches expected criteria.
 
     Args:
         branch (str): Exact branch name to match (e.g., "main", "develop")
-        pattern (str): Regex pattern to match (e.g., "feature/.*", "release/v\\d+")
+        pattern (str): Regex pattern to match (e.g., "feature/.*", "release/v\\d+").
+            At most 256 characters; matched with re2 when it is installed.
 
     Examples:
         # Exact match
@@ -60,29 +180,29 @@ class GitBranchValidator(BaseValidator):
     """
 
     def validate(self, args: Dict[str, Any], context: Dict[str, Any]) -> bool:
+        import subprocess
+
         expected_branch = args.get('branch')
         pattern = args.get('pattern')
 
         try:
-            result = subprocess.run(
-                ['git', 'branch', '--show-current'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode != 0:
+            current_branch = _current_branch()
+            if current_branch is None:
                 return False
 
-            current_branch = result.stdout.strip()
-
             # Exact match
             if expected_branch:
                 return current_branch == expected_branch
 
-            # Pattern match
+            # Pattern match (anchored at the start, like re.match)
             if pattern:
-                return bool(re.match(pattern, current_branch))
+                if len(pattern) > _MAX_PATTERN_LENGTH:
+                    return False
+                try:
+                    compiled = _compile(pattern)
+                except _PATTERN_ERRORS:
+                    return False
+                return bool(compiled.match(current_branch))
 
             # No criteria specified
             return False
@@ -98,9 +218,19 @@ class CoverageValidator(BaseValidator):
     Requires pytest-cov to be installed:
         pip install pytest-cov
 
+    A passing coverage.json is kept in cache_dir, keyed by a digest (path,
+    size, mtime) of every file under source and the test paths, plus the
+    pytest/coverage config files. While none of those change, later
+    validations reuse it instead of re-running pytest. Inputs outside those
+    paths (installed packages, files read from elsewhere) are not part of
+    the key. Only the most recent CACHE_ENTRIES reports are kept.
+
     Args:
         minimum (int): Minimum coverage percentage (default: 80)
         source (str): Source directory to measure (default: "src")
+        tests (list): Test paths included in the cache key (default: ["tests"])
+        cache_dir (str): Where passing reports are kept
+            (default: ".workflow/coverage_cache")
 
     Examples:
         conditions:
@@ -111,8 +241,23 @@ class CoverageValidator(BaseValidator):
     """
 
     def validate(self, args: Dict[str, Any], context: Dict[str, Any]) -> bool:
+        import shutil
+        import subprocess
+
         minimum = args.get('minimum', 80)
         source = args.get('source', 'src')
+        tests = args.get('tests', ['tests'])
+        cache_dir = args.get('cache_dir', os.path.join('.workflow', 'coverage_cache'))
+
+        digest = self._source_digest(source, tests)
+        cache_path = os.path.join(cache_dir, f"{digest}.json")
+        if self._cached_percent(cache_path) >= minimum:
+            # Mark it recently used so pruning keeps it
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return True
 
         try:
             # Run pytest with coverage
@@ -126,15 +271,98 @@ class CoverageValidator(BaseValidator):
                 ],
                 capture_output=True,
                 text=True,
-                timeout=300  # 5 minute timeout for tests
+                timeout=300,  # 5 minute timeout for tests
+                check=False,
+                close_fds=False,
+                start_new_session=True
             )
 
             # If pytest returns 0, coverage threshold was met
-            return result.returncode == 0
+            if result.returncode != 0:
+                return False
+
+            # Only passing runs are cached. Editing sources, tests or the
+            # pytest/coverage config changes the key and forces a re-run.
+            if os.path.isfile('coverage.json'):
+                os.makedirs(cache_dir, exist_ok=True)
+                shutil.copyfile('coverage.json', cache_path)
+                self._prune_cache(cache_dir, self.CACHE_ENTRIES)
+            return True
 
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
 
+    # Cached reports kept per cache_dir; older ones are deleted
+    CACHE_ENTRIES = 8
+
+    # Files outside source/tests that change what pytest runs or measures
+    CONFIG_FILES = ('pyproject.toml', 'setup.cfg', 'pytest.ini', 'tox.ini',
+                    '.coveragerc', 'conftest.py')
+
+    @classmethod
+    def _source_digest(cls, source: str, tests: Iterable[str] = ()) -> str:
+        """Digest of (path, size, mtime) for the inputs of a coverage run.
+
+        Covers every file under source and the test paths (data files and
+        compiled extensions included) and the pytest/coverage config files.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        entries = []
+
+        def add(path: str, st: os.stat_result) -> None:
+            entries.append(f"{path}\0{st.st_size}\0{st.st_mtime_ns}")
+
+        for root in [source, *tests]:
+            if os.path.isfile(root):
+                add(root, os.stat(root))
+                continue
+            stack = [root]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as it:
+                        for entry in it:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name != '__pycache__':
+                                    stack.append(entry.path)
+                            else:
+                                add(entry.path, entry.stat())
+                except OSError:
+                    continue
+
+        for name in cls.CONFIG_FILES:
+            try:
+                add(name, os.stat(name))
+            except OSError:
+                continue
+
+        for line in sorted(entries):
+            digest.update(line.encode('utf-8', 'surrogateescape'))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    @staticmethod
+    def _prune_cache(cache_dir: str, keep: int) -> None:
+        """Delete all but the newest keep reports in cache_dir."""
+        try:
+            with os.scandir(cache_dir) as it:
+                reports = [e for e in it if e.name.endswith('.json') and e.is_file()]
+            reports.sort(key=lambda e: e.stat().st_mtime_ns, reverse=True)
+            for entry in reports[keep:]:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _cached_percent(cache_path: str) -> float:
+        """Total coverage from a cached report, or -1 if there is none."""
+        import json
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return float(json.load(f)['totals']['percent_covered'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return -1.0
+
 
 class DependencyValidator(BaseValidator):
     """
@@ -157,6 +385,9 @@ class DependencyValidator(BaseValidator):
     """
 
     def validate(self, args: Dict[str, Any], context: Dict[str, Any]) -> bool:
+        import json
+        import subprocess
+
         requirements_file = args.get('requirements_file', 'requirements.txt')
         ignore_ids = args.get('ignore', [])
 
@@ -167,11 +398,15 @@ class DependencyValidator(BaseValidator):
             for vuln_id in ignore_ids:
                 cmd.extend(['--ignore', str(vuln_id)])
 
+            # Keep stdout as bytes: both json.loads and orjson.loads accept
+            # it, so the report is never decoded into an intermediate str
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
-                timeout=60
+                timeout=60,
+                check=False,
+                close_fds=False,
+                start_new_session=True
             )
 
             # Return code 0 means no vulnerabilities found
@@ -180,10 +415,17 @@ class DependencyValidator(BaseValidator):
 
             # Parse output to check if there are actual vulnerabilities
             try:
-                data = json.loads(result.stdout)
-                # Empty vulnerabilities list means safe
-                return len(data.get('vulnerabilities', [])) == 0
-            except json.JSONDecodeError:
+                if HAS_ORJSON:
+                    data = orjson.loads(result.stdout)
+                else:
+                    data = json.loads(result.stdout)
+                # Only an explicit, empty top-level vulnerabilities list means safe
+                if not isinstance(data, dict):
+                    return False
+                vulnerabilities = data.get('vulnerabilities')
+                return isinstance(vulnerabilities, list) and not vulnerabilities
+            except ValueError:
+                # json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
                 return False
 
         except (subprocess.TimeoutExpired, FileNotFoundError):
@@ -209,25 +451,26 @@ class EnvVarValidator(BaseValidator):
     """
 
     def validate(self, args: Dict[str, Any], context: Dict[str, Any]) -> bool:
-        import os
-
         required = args.get('required', [])
-
-        for var in required:
-            if not os.environ.get(var):
-                return False
-
-        return True
+        environ = os.environ
+        return all(environ.get(var) for var in required)
 
 
 class NoTODOValidator(BaseValidator):
     """
     Validates that no TODO/FIXME comments exist in the codebase.
 
+    Version control and dependency directories (.git, node_modules, ...)
+    are never searched, and binary files (a NUL byte in the first 8 KiB)
+    are skipped.
+
     Args:
         paths (list): Paths to search (default: ["src"])
-        patterns (list): Patterns to search for (default: ["TODO", "FIXME"])
-        exclude (list): Paths to exclude
+        patterns (list): Literal strings to search for (default: ["TODO",
+            "FIXME", "XXX", "HACK"]). These are matched as plain text, not
+            as grep regexes, so "TODO.*urgent" only matches that exact text.
+        exclude (list): Paths to exclude; any file or directory whose path
+            contains one of these strings is skipped
 
     Examples:
         conditions:
@@ -237,35 +480,174 @@ class NoTODOValidator(BaseValidator):
               exclude: ["src/vendor"]
     """
 
+    DEFAULT_PATTERNS = ('TODO', 'FIXME', 'XXX', 'HACK')
+    SKIP_DIRS = frozenset({
+        '.git', '.hg', '.svn', 'node_modules', '__pycache__',
+        '.venv', 'venv', '.tox', '.mypy_cache', '.pytest_cache',
+    })
+    _DEFAULT_COMBINED = re.compile('|'.join(map(re.escape, DEFAULT_PATTERNS)))
+
     def validate(self, args: Dict[str, Any], context: Dict[str, Any]) -> bool:
         paths = args.get('paths', ['src'])
-        patterns = args.get('patterns', ['TODO', 'FIXME', 'XXX', 'HACK'])
+        patterns = args.get('patterns', self.DEFAULT_PATTERNS)
         exclude = args.get('exclude', [])
 
+        if not patterns:
+            return True
+
+        # One scan per file for all patterns, instead of one grep per pattern
+        if tuple(patterns) == self.DEFAULT_PATTERNS:
+            combined = self._DEFAULT_COMBINED
+        else:
+            combined = self._combine(tuple(patterns))
+
         for path in paths:
-            for pattern in patterns:
-                try:
-                    cmd = ['grep', '-r', '-l', pattern, path]
-
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=30
-                    )
-
-                    # If grep finds matches (return code 0), filter exclusions
-                    if result.returncode == 0:
-                        matches = result.stdout.strip().split('\n')
-                        # Filter out excluded paths
-                        matches = [m for m in matches if not any(e in m for e in exclude)]
-                        if matches:
-                            return False
-
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    pass
+            for file_path in self._iter_files(path, exclude):
+                if any(e in file_path for e in exclude):
+                    continue
+                if self._file_contains(file_path, combined):
+                    return False
+
+        return True
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _combine(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+        return re.compile('|'.join(map(re.escape, patterns)))
+
+    @classmethod
+    def _iter_files(cls, path: str, exclude: Iterable[str] = ()):
+        """Yield every file under path (or path itself if it is a file)."""
+        if os.path.isfile(path):
+            yield path
+            return
+        for root, dirs, files in os.walk(path):
+            # Prune in place so os.walk never descends into skipped dirs
+            dirs[:] = [
+                d for d in dirs
+                if d not in cls.SKIP_DIRS
+                and not any(e in os.path.join(root, d) for e in exclude)
+            ]
+            for name in files:
+                yield os.path.join(root, name)
+
+    @staticmethod
+    def _file_contains(file_path: str, pattern: "re.Pattern[str]") -> bool:
+        import io
+
+        try:
+            with open(file_path, 'rb') as f:
+                # Like grep -I: a NUL byte in the first block means binary
+                if b'\0' in f.read(8192):
+                    return False
+                f.seek(0)
+                for line in io.TextIOWrapper(f, encoding='utf-8', errors='ignore'):
+                    if pattern.search(line):
+                        return True
+        except OSError:
+            pass
+        return False
+
+
+def run_parallel(items: Iterable[Tuple[BaseValidator, Dict[str, Any], Dict[str, Any]]]) -> bool:
+    """
+    Run independent validators concurrently and return True if all pass.
+
+    Each item is a ``(validator, args, context)`` tuple. The validators in
+    this module spend nearly all their time waiting on subprocesses, so
+    threads overlap that wait and the total time becomes the slowest check
+    rather than the sum. The result is False as soon as any validator
+    fails; checks that haven't started are then cancelled, and ones already
+    running are waited for so none of their subprocesses outlive the call.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    items = list(items)
+    if not items:
+        return True
 
+    executor = ThreadPoolExecutor(max_workers=len(items))
+    try:
+        futures = [executor.submit(v.validate, args, ctx) for v, args, ctx in items]
+        for future in as_completed(futures):
+            if not future.result():
+                return False
         return True
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class BatchValidator(BaseValidator):
+    """
+    Runs several validators concurrently.
+
+    Rules are resolved like top-level conditions: through the ``plugins``
+    section of the workflow config, so any alias configured there works.
+    The validators in this module are also available under their default
+    names (git_branch, coverage, deps_secure, env_vars, no_todos) when the
+    config doesn't define them. An unknown rule, or a plugin that fails to
+    load, fails the batch instead of raising.
+
+    Args:
+        validators (list): Items of the form {"rule": <name>, "args": {...}}
+        config (str): Workflow config to read plugins from (default: the
+            config the controller loaded, i.e. ${config_path})
+
+    Examples:
+        conditions:
+          - rule: all_of
+            args:
+              validators:
+                - rule: coverage
+                  args: {minimum: 80}
+                - rule: deps_secure
+    """
+
+    DEFAULT_RULES = {
+        'git_branch': GitBranchValidator,
+        'coverage': CoverageValidator,
+        'deps_secure': DependencyValidator,
+        'env_vars': EnvVarValidator,
+        'no_todos': NoTODOValidator,
+    }
+
+    def validate(self, args: Dict[str, Any], context: Dict[str, Any]) -> bool:
+        config_path = args.get('config') or context.get('config_path', 'workflow.yaml')
+        plugins = self._plugin_paths(config_path)
+        items = []
+        for entry in args.get('validators', []):
+            validator_cls = self._resolve_rule(entry.get('rule'), plugins)
+            if validator_cls is None:
+                return False
+            items.append((validator_cls(), entry.get('args') or {}, context))
+
+        return run_parallel(items)
+
+    @staticmethod
+    def _plugin_paths(config_path: str) -> Dict[str, str]:
+        """The config's plugins section, or {} if it can't be read."""
+        try:
+            from workflow.core.parser import ConfigParserV2
+            return dict(ConfigParserV2.load(config_path).plugins)
+        except (ImportError, OSError):
+            # Standalone use or no config: only the default names resolve
+            return {}
+
+    @classmethod
+    def _resolve_rule(cls, name: Optional[str], plugins: Dict[str, str]) -> Optional[type]:
+        """Validator class for a rule name, or None if it can't be loaded."""
+        class_path = plugins.get(name)
+        if class_path is None:
+            return cls.DEFAULT_RULES.get(name)
+
+        from workflow.core.validator import ValidatorRegistry
+        registry = ValidatorRegistry()
+        try:
+            registry.load_plugin(name, class_path)
+        except (ImportError, TypeError):
+            # Bad module/class path, or a class that isn't a BaseValidator
+            return None
+        return registry.get(name)
 
 
 # Export all validators
@@ -275,4 +657,6 @@ __all__ = [
     'DependencyValidator',
     'EnvVarValidator',
     'NoTODOValidator',
+    'BatchValidator',
+    'run_parallel',
 ]
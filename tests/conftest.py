@@ -0,0 +1,19 @@
+"""Shared pytest fixtures."""
+import copy
+
+import pytest
+from workflow.core.context import WorkflowContext
+
+
+@pytest.fixture(scope="session")
+def base_ctx():
+    """A WorkflowContext built once per session. Treat as read-only."""
+    return WorkflowContext()
+
+
+@pytest.fixture
+def ctx(base_ctx):
+    """A per-test WorkflowContext whose data can be mutated freely."""
+    fresh = copy.copy(base_ctx)
+    fresh.data = dict(base_ctx.data)
+    return fresh
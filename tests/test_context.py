@@ -2,47 +2,41 @@
 import os
 import sys
 import pytest
-from workflow.core.context import WorkflowContext, ContextResolver, WhenEvaluator
+from workflow.core.context import ContextResolver, WhenEvaluator
 
 
 class TestBuiltinVariables:
     """Test built-in variables are properly injected."""
 
-    def test_python_variable_exists(self):
+    def test_python_variable_exists(self, base_ctx):
         """${python} should resolve to current Python interpreter."""
-        ctx = WorkflowContext()
-        assert 'python' in ctx.data
-        assert ctx.data['python'] == sys.executable
+        assert 'python' in base_ctx.data
+        assert base_ctx.data['python'] == sys.executable
 
-    def test_python_exe_alias(self):
+    def test_python_exe_alias(self, base_ctx):
         """${python_exe} should be an alias for ${python}."""
-        ctx = WorkflowContext()
-        assert ctx.data['python_exe'] == ctx.data['python']
+        assert base_ctx.data['python_exe'] == base_ctx.data['python']
 
-    def test_cwd_variable(self):
+    def test_cwd_variable(self, base_ctx):
         """${cwd} should resolve to current working directory."""
-        ctx = WorkflowContext()
-        assert ctx.data['cwd'] == os.getcwd()
+        assert base_ctx.data['cwd'] == os.getcwd()
 
-    def test_project_root_variable(self):
+    def test_project_root_variable(self, base_ctx):
         """${project_root} should exist for backwards compatibility."""
-        ctx = WorkflowContext()
-        assert 'project_root' in ctx.data
+        assert 'project_root' in base_ctx.data
 
 
 class TestContextResolver:
     """Test variable resolution logic."""
 
-    def test_simple_variable(self):
+    def test_simple_variable(self, base_ctx):
         """Simple variable substitution should work."""
-        ctx = WorkflowContext()
-        resolver = ctx.get_resolver()
+        resolver = base_ctx.get_resolver()
         result = resolver.resolve("Python: ${python}")
         assert sys.executable in result
 
-    def test_nested_variable_resolution(self):
+    def test_nested_variable_resolution(self, ctx):
         """Nested variables should be resolved recursively."""
-        ctx = WorkflowContext()
         ctx.data['test_cmd'] = "PYTHONPATH=${cwd}/src ${python} -m pytest"
 
         resolver = ctx.get_resolver()
@@ -54,9 +48,8 @@ class TestContextResolver:
         assert sys.executable in result
         assert os.getcwd() in result
 
-    def test_double_nested_variables(self):
+    def test_double_nested_variables(self, ctx):
         """Variables within variables within variables should resolve."""
-        ctx = WorkflowContext()
         ctx.data['inner'] = "${python}"
         ctx.data['outer'] = "Run: ${inner}"
 
@@ -67,16 +60,14 @@ class TestContextResolver:
         assert "${inner}" not in result
         assert "${python}" not in result
 
-    def test_unknown_variable_preserved(self):
+    def test_unknown_variable_preserved(self, base_ctx):
         """Unknown variables should be preserved as-is."""
-        ctx = WorkflowContext()
-        resolver = ctx.get_resolver()
+        resolver = base_ctx.get_resolver()
         result = resolver.resolve("${unknown_var}")
         assert result == "${unknown_var}"
 
-    def test_max_depth_prevents_infinite_loop(self):
+    def test_max_depth_prevents_infinite_loop(self, ctx):
         """Circular references should not cause infinite loops."""
-        ctx = WorkflowContext()
         ctx.data['a'] = "${b}"
         ctx.data['b'] = "${a}"  # Circular reference
 
@@ -90,9 +81,8 @@ class TestContextResolver:
 class TestArgsSubstitution:
     """Test ${args} substitution (special case for CLI --args)."""
 
-    def test_args_in_context(self):
+    def test_args_in_context(self, ctx):
         """${args} should be resolved when args is in context."""
-        ctx = WorkflowContext()
         ctx.data['args'] = "feat: add new feature"
 
         resolver = ctx.get_resolver()
@@ -102,9 +92,8 @@ class TestArgsSubstitution:
         assert result == 'git commit -m "feat: add new feature"'
         assert "${args}" not in result
 
-    def test_args_nested_in_variable(self):
+    def test_args_nested_in_variable(self, ctx):
         """${args} inside another variable should be resolved."""
-        ctx = WorkflowContext()
         ctx.data['args'] = "fix: bug fix"
         ctx.data['commit_cmd'] = 'git commit -m "${args}"'
 
@@ -115,9 +104,8 @@ class TestArgsSubstitution:
         assert "${args}" not in result
         assert "${commit_cmd}" not in result
 
-    def test_args_with_special_characters(self):
+    def test_args_with_special_characters(self, ctx):
         """Args with special characters should work correctly."""
-        ctx = WorkflowContext()
         ctx.data['args'] = "feat(auth): add OAuth2 login"
 
         resolver = ctx.get_resolver()
@@ -127,9 +115,8 @@ class TestArgsSubstitution:
         # No stray $ should remain
         assert "$feat" not in result
 
-    def test_dollar_sign_fully_removed(self):
+    def test_dollar_sign_fully_removed(self, ctx):
         """$ prefix should be completely removed after substitution."""
-        ctx = WorkflowContext()
         ctx.data['my_var'] = "hello world"
 
         resolver = ctx.get_resolver()
@@ -141,38 +128,35 @@ class TestArgsSubstitution:
         assert "${my_var}" not in result
 
 
+@pytest.mark.xdist_group("subproc")
 class TestCommandExecution:
     """Test that commands execute correctly with resolved variables."""
 
-    def test_python_version_command(self):
+    def test_python_version_command(self, base_ctx):
         """${python} --version should execute successfully."""
         import subprocess
 
-        ctx = WorkflowContext()
-        resolver = ctx.get_resolver()
+        resolver = base_ctx.get_resolver()
         cmd = resolver.resolve("${python} --version")
+        assert cmd == f"{base_ctx.data['python']} --version"
 
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True,
-            env=os.environ.copy()
-        )
+        result = subprocess.run([base_ctx.data['python'], '--version'],
+                                capture_output=True, text=True)
         assert result.returncode == 0
         assert "Python" in result.stdout
 
-    def test_nested_command_execution(self):
+    def test_nested_command_execution(self, ctx):
         """Commands with nested variables should execute correctly."""
         import subprocess
 
-        ctx = WorkflowContext()
         ctx.data['version_cmd'] = "${python} --version"
 
         resolver = ctx.get_resolver()
         cmd = resolver.resolve("${version_cmd}")
+        assert cmd == f"{ctx.data['python']} --version"
 
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True,
-            env=os.environ.copy()
-        )
+        result = subprocess.run([ctx.data['python'], '--version'],
+                                capture_output=True, text=True)
         assert result.returncode == 0
 
 
@@ -235,6 +219,33 @@ class TestWhenEvaluator:
         with pytest.raises(ValueError):
             evaluator.evaluate("this is not valid")
 
+    def test_bare_word_with_hyphen(self):
+        """Unquoted values with '-' compare as plain strings."""
+        evaluator = WhenEvaluator({"active_module": "user-auth"})
+
+        assert evaluator.evaluate('${active_module} == user-auth') is True
+        assert evaluator.evaluate('${active_module} != user-auth') is False
+
+    def test_bare_word_with_slash(self):
+        """Unquoted values with '/' compare as plain strings."""
+        evaluator = WhenEvaluator({"b": "feature/x"})
+
+        assert evaluator.evaluate('${b} == feature/x') is True
+        assert evaluator.evaluate('${b} == feature/y') is False
+
+    def test_and_is_not_an_operator(self):
+        """'and' is not supported: the rest of the line is one bare operand."""
+        evaluator = WhenEvaluator({"m": "core", "v": "1.2"})
+
+        assert evaluator.evaluate('${m} == "core" and ${v} == "1.2"') is False
+
+    def test_compiled_expression_reused_across_contexts(self):
+        """The same expression must be re-evaluated against each context."""
+        expr = '${module} in ["api", "web"]'
+        assert WhenEvaluator({"module": "api"}).evaluate(expr) is True
+        assert WhenEvaluator({"module": "cli"}).evaluate(expr) is False
+        assert WhenEvaluator({}).evaluate(expr) is False
+
     def test_realistic_use_case(self):
         """Test realistic workflow condition."""
         # Meta module should skip implementation checks
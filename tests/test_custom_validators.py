@@ -0,0 +1,325 @@
+"""Tests for the example validators in examples/custom-plugins."""
+import importlib.util
+import json
+import os
+import subprocess
+import threading
+import time
+import pytest
+from workflow.core.validator import BaseValidator
+
+_CUSTOM_PY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "examples", "custom-plugins", "validators", "custom.py",
+)
+
+# Load by path so the example's "validators" package never lands on sys.path
+_spec = importlib.util.spec_from_file_location("custom_validators", _CUSTOM_PY)
+custom = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(custom)
+
+
+def _fake_git(stdout="", returncode=0, calls=None):
+    """Stand-in for subprocess.run that records the git fallback."""
+    def run(cmd, **kwargs):
+        if calls is not None:
+            calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, returncode, stdout=stdout)
+    return run
+
+
+def _make_repo(root, head="ref: refs/heads/main"):
+    """Create a minimal .git directory whose HEAD reads head."""
+    git_dir = root / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text(head + "\n")
+    return git_dir
+
+
+class TestGitBranchValidator:
+    """GitBranchValidator reads the branch from .git/HEAD."""
+
+    def test_branch_switch_is_picked_up(self, tmp_path, monkeypatch):
+        """A checkout between validations is seen on the next call."""
+        git_dir = _make_repo(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(subprocess, "run", _fake_git(returncode=1))
+        validator = custom.GitBranchValidator()
+
+        assert validator.validate({"branch": "main"}, {}) is True
+
+        (git_dir / "HEAD").write_text("ref: refs/heads/feature/x\n")
+        assert validator.validate({"branch": "main"}, {}) is False
+        assert validator.validate({"branch": "feature/x"}, {}) is True
+
+    def test_nested_subdirectory(self, tmp_path, monkeypatch):
+        """HEAD is found by walking up from a nested working directory."""
+        _make_repo(tmp_path, "ref: refs/heads/develop")
+        nested = tmp_path / "a" / "b" / "c"
+        nested.mkdir(parents=True)
+        monkeypatch.chdir(nested)
+        calls = []
+        monkeypatch.setattr(subprocess, "run", _fake_git(calls=calls))
+        assert custom.GitBranchValidator().validate({"branch": "develop"}, {}) is True
+        assert calls == []
+
+    def test_gitdir_file_is_followed(self, tmp_path, monkeypatch):
+        """A worktree/submodule .git file points at the real git dir."""
+        real = tmp_path / "main-repo" / ".git" / "worktrees" / "wt"
+        real.mkdir(parents=True)
+        (real / "HEAD").write_text("ref: refs/heads/feature/wt\n")
+        worktree = tmp_path / "wt"
+        (worktree / "sub").mkdir(parents=True)
+        (worktree / ".git").write_text("gitdir: ../main-repo/.git/worktrees/wt\n")
+        monkeypatch.chdir(worktree / "sub")
+        calls = []
+        monkeypatch.setattr(subprocess, "run", _fake_git(calls=calls))
+        assert custom.GitBranchValidator().validate({"branch": "feature/wt"}, {}) is True
+        assert calls == []
+
+    def test_detached_head_falls_back_to_git(self, tmp_path, monkeypatch):
+        """A detached HEAD names no branch, so the git CLI decides."""
+        _make_repo(tmp_path, "3f786850e387550fdab836ed7e6dc881de23001b")
+        monkeypatch.chdir(tmp_path)
+        calls = []
+        monkeypatch.setattr(subprocess, "run", _fake_git(stdout="\n", calls=calls))
+        assert custom.GitBranchValidator().validate({"branch": "main"}, {}) is False
+        assert calls == [["git", "branch", "--show-current"]]
+
+    @pytest.mark.parametrize("dot_git", [
+        "not a gitdir line\n",
+        "gitdir: missing/dir\n",
+    ])
+    def test_unreadable_gitdir_falls_back_to_git(self, tmp_path, monkeypatch, dot_git):
+        (tmp_path / ".git").write_text(dot_git)
+        monkeypatch.chdir(tmp_path)
+        calls = []
+        monkeypatch.setattr(subprocess, "run", _fake_git(stdout="main\n", calls=calls))
+        assert custom.GitBranchValidator().validate({"branch": "main"}, {}) is True
+        assert calls == [["git", "branch", "--show-current"]]
+
+    @pytest.fixture
+    def on_branch(self, tmp_path, monkeypatch):
+        _make_repo(tmp_path, "ref: refs/heads/feature/login")
+        monkeypatch.chdir(tmp_path)
+
+    def test_pattern_matches(self, on_branch):
+        validator = custom.GitBranchValidator()
+        assert validator.validate({"pattern": r"feature/\w+"}, {}) is True
+        assert validator.validate({"pattern": "release/.*"}, {}) is False
+
+    def test_oversized_pattern_is_rejected(self, on_branch, monkeypatch):
+        """Patterns over the length limit fail without being compiled."""
+        compiled = []
+        monkeypatch.setattr(custom, "_compile", lambda p: compiled.append(p))
+        pattern = "(feature/)+" * 30
+        assert len(pattern) > custom._MAX_PATTERN_LENGTH
+        assert custom.GitBranchValidator().validate({"pattern": pattern}, {}) is False
+        assert compiled == []
+
+    def test_pattern_at_limit_still_matches(self, on_branch):
+        pattern = "feature/" + ".?" * ((custom._MAX_PATTERN_LENGTH - 8) // 2)
+        assert len(pattern) <= custom._MAX_PATTERN_LENGTH
+        assert custom.GitBranchValidator().validate({"pattern": pattern}, {}) is True
+
+    def test_invalid_pattern_is_rejected(self, on_branch):
+        assert custom.GitBranchValidator().validate({"pattern": "feature/("}, {}) is False
+
+
+class TestNoTODOValidator:
+    """NoTODOValidator scans text files in-process."""
+
+    def test_finds_todo_in_source(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "mod.py").write_text("x = 1  # TODO: remove\n")
+        validator = custom.NoTODOValidator()
+        assert validator.validate({"paths": [str(tmp_path)]}, {}) is False
+
+    def test_skip_dirs_are_pruned(self, tmp_path):
+        """Matches under .git, node_modules, ... are never reported."""
+        for skipped in ("node_modules", ".git", "__pycache__"):
+            (tmp_path / skipped / "deep").mkdir(parents=True)
+            (tmp_path / skipped / "deep" / "f.js").write_text("// TODO\n")
+        (tmp_path / "main.py").write_text("print('clean')\n")
+        files = list(custom.NoTODOValidator._iter_files(str(tmp_path)))
+        assert files == [str(tmp_path / "main.py")]
+        validator = custom.NoTODOValidator()
+        assert validator.validate({"paths": [str(tmp_path)]}, {}) is True
+
+    def test_exclude_prunes_directory(self, tmp_path):
+        (tmp_path / "vendor").mkdir()
+        (tmp_path / "vendor" / "lib.py").write_text("# FIXME\n")
+        validator = custom.NoTODOValidator()
+        args = {"paths": [str(tmp_path)], "exclude": ["vendor"]}
+        assert validator.validate(args, {}) is True
+
+    def test_binary_file_is_skipped(self, tmp_path):
+        """A file with a NUL byte in its first block is treated as binary."""
+        (tmp_path / "blob.bin").write_bytes(b"\x00\x01TODO\nHACK\n")
+        validator = custom.NoTODOValidator()
+        assert validator.validate({"paths": [str(tmp_path)]}, {}) is True
+
+    def test_patterns_are_literal(self, tmp_path):
+        (tmp_path / "a.txt").write_text("TODO later\n")
+        validator = custom.NoTODOValidator()
+        args = {"paths": [str(tmp_path)], "patterns": ["TODO.*urgent"]}
+        assert validator.validate(args, {}) is True
+        (tmp_path / "b.txt").write_text("see TODO.*urgent\n")
+        assert validator.validate(args, {}) is False
+
+
+# ─── BatchValidator ───
+
+_CALLS = []
+_CALLS_LOCK = threading.Lock()
+_PASS_STARTED = threading.Event()
+
+
+class PassValidator(BaseValidator):
+    """Passes after an optional delay, recording when it finished."""
+
+    def validate(self, args, context):
+        _PASS_STARTED.set()
+        time.sleep(args.get("delay", 0))
+        with _CALLS_LOCK:
+            _CALLS.append(args.get("name", "pass"))
+        return True
+
+
+class FailValidator(BaseValidator):
+    """Fails, once a PassValidator is running if wait_for_pass is set."""
+
+    def validate(self, args, context):
+        if args.get("wait_for_pass"):
+            _PASS_STARTED.wait(timeout=5)
+        return False
+
+
+_BATCH_YAML = """
+version: "2.0"
+plugins:
+  ok: "tests.test_custom_validators.PassValidator"
+  bad: "tests.test_custom_validators.FailValidator"
+  broken: "tests.no_such_module.Validator"
+stages:
+  P1:
+    id: "P1"
+    label: "Start"
+"""
+
+
+@pytest.fixture
+def batch_ctx(tmp_path):
+    """Context as the controller builds it, pointing at a config with plugins."""
+    config = tmp_path / "workflow.yaml"
+    config.write_text(_BATCH_YAML)
+    _CALLS.clear()
+    _PASS_STARTED.clear()
+    return {"config_path": str(config)}
+
+
+class TestBatchValidator:
+    """BatchValidator resolves rules through the config and runs them together."""
+
+    def test_all_pass(self, batch_ctx, monkeypatch):
+        monkeypatch.setenv("_WORKFLOW_BATCH_VAR", "1")
+        args = {"validators": [
+            {"rule": "ok", "args": {"name": "a"}},
+            {"rule": "ok", "args": {"name": "b"}},
+            {"rule": "env_vars", "args": {"required": ["_WORKFLOW_BATCH_VAR"]}},
+        ]}
+        assert custom.BatchValidator().validate(args, batch_ctx) is True
+        assert sorted(_CALLS) == ["a", "b"]
+
+    def test_one_failure_fails_batch(self, batch_ctx):
+        """A failing rule fails the batch; running checks finish before return."""
+        args = {"validators": [
+            {"rule": "bad", "args": {"wait_for_pass": True}},
+            {"rule": "ok", "args": {"name": "slow", "delay": 0.2}},
+        ]}
+        assert custom.BatchValidator().validate(args, batch_ctx) is False
+        assert _CALLS == ["slow"]
+
+    def test_unknown_plugin_fails_rule(self, batch_ctx):
+        """A plugin that can't be imported fails the batch instead of raising."""
+        args = {"validators": [{"rule": "ok"}, {"rule": "broken"}]}
+        assert custom.BatchValidator().validate(args, batch_ctx) is False
+        assert _CALLS == []
+
+    def test_undefined_rule_fails(self, batch_ctx):
+        args = {"validators": [{"rule": "nope"}]}
+        assert custom.BatchValidator().validate(args, batch_ctx) is False
+
+    def test_config_arg_overrides_context(self, batch_ctx, tmp_path):
+        """Without the loaded config, plugin aliases don't resolve."""
+        args = {"validators": [{"rule": "ok"}],
+                "config": str(tmp_path / "missing.yaml")}
+        assert custom.BatchValidator().validate(args, batch_ctx) is False
+
+
+# ─── CoverageValidator ───
+
+
+def _fake_pytest(calls, percent=90.0):
+    """Stand-in for the pytest run: writes coverage.json and passes."""
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        with open("coverage.json", "w", encoding="utf-8") as f:
+            json.dump({"totals": {"percent_covered": percent}}, f)
+        return subprocess.CompletedProcess(cmd, 0)
+    return run
+
+
+@pytest.fixture
+def cov_project(tmp_path, monkeypatch):
+    """A project with src/, tests/ and a pytest config, as the cwd."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "mod.py").write_text("x = 1\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_mod.py").write_text("def test_x(): pass\n")
+    (tmp_path / "pytest.ini").write_text("[pytest]\n")
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    monkeypatch.setattr(subprocess, "run", _fake_pytest(calls))
+    return tmp_path, calls
+
+
+class TestCoverageValidator:
+    """CoverageValidator reuses passing reports while its inputs are unchanged."""
+
+    def test_cache_hit(self, cov_project):
+        root, calls = cov_project
+        validator = custom.CoverageValidator()
+        assert validator.validate({}, {}) is True
+        assert validator.validate({}, {}) is True
+        assert len(calls) == 1
+        assert len(os.listdir(root / ".workflow" / "coverage_cache")) == 1
+
+    @pytest.mark.parametrize("changed", [
+        "src/mod.py", "src/data.bin", "tests/test_mod.py", "tests/fixture.json", "pytest.ini",
+    ])
+    def test_miss_after_input_change(self, cov_project, changed):
+        """Editing a source, data, test or config file forces a re-run."""
+        root, calls = cov_project
+        validator = custom.CoverageValidator()
+        assert validator.validate({}, {}) is True
+        (root / changed).write_text("changed contents\n")
+        assert validator.validate({}, {}) is True
+        assert len(calls) == 2
+
+    def test_failing_run_is_not_cached(self, cov_project, monkeypatch):
+        root, calls = cov_project
+        monkeypatch.setattr(
+            subprocess, "run", lambda cmd, **kw: subprocess.CompletedProcess(cmd, 1))
+        assert custom.CoverageValidator().validate({}, {}) is False
+        assert not (root / ".workflow" / "coverage_cache").exists()
+
+    def test_old_entries_are_evicted(self, cov_project, monkeypatch):
+        root, calls = cov_project
+        monkeypatch.setattr(custom.CoverageValidator, "CACHE_ENTRIES", 2)
+        validator = custom.CoverageValidator()
+        for i in range(4):
+            (root / "src" / "mod.py").write_text("x = 1\n" * (i + 1))
+            assert validator.validate({}, {}) is True
+        assert len(calls) == 4
+        assert len(os.listdir(root / ".workflow" / "coverage_cache")) == 2
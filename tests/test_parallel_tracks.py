@@ -1,10 +1,15 @@
 """Tests for parallel tracks feature (v1 + v2)."""
+import argparse
+import functools
 import json
-import os
-import tempfile
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, PropertyMock
+from workflow.core.audit import WorkflowAuditManager
+from workflow.core.controller import WorkflowController
+from workflow.core import state as state_module
 from workflow.core.state import WorkflowState, TrackState, CheckItem, PhaseNode
+from workflow.i18n import set_language
 
 
 # ─── Phase 2.1: Data Model Tests ───
@@ -91,16 +96,7 @@ class TestTrackState:
             created_at="2026-02-10T14:00:00"
         )
         restored = TrackState.from_dict(original.to_dict())
-        assert restored.current_stage == original.current_stage
-        assert restored.active_module == original.active_module
-        assert restored.label == original.label
-        assert restored.status == original.status
-        assert restored.created_at == original.created_at
-        assert len(restored.checklist) == 2
-        assert restored.checklist[0].text == "a"
-        assert restored.checklist[0].checked is True
-        assert restored.checklist[1].text == "b"
-        assert restored.checklist[1].checked is False
+        assert restored == original
 
 
 class TestWorkflowStateTracksExtension:
@@ -197,35 +193,42 @@ class TestWorkflowStateTracksExtension:
             },
             active_track="A"
         )
-        d = state.to_dict()
-        restored = WorkflowState.from_dict(d)
-
-        assert restored.current_milestone == "M2"
-        assert len(restored.tracks) == 2
-        assert restored.tracks["A"].current_stage == "P6"
-        assert restored.tracks["A"].status == "in_progress"
-        assert restored.tracks["B"].status == "complete"
-        assert restored.active_track == "A"
+        restored = WorkflowState.from_dict(state.to_dict())
+        assert restored == state
 
-    def test_file_persistence_round_trip(self):
-        """Save to file and load back."""
+    def test_bytes_round_trip(self):
+        """dumps() → loads() without touching the filesystem."""
         state = WorkflowState(
             current_stage="P4",
             tracks={"X": TrackState(current_stage="P1", label="test")},
             active_track="X"
         )
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            tmp_path = f.name
-
-        try:
-            state.save(tmp_path)
-            loaded = WorkflowState.load(tmp_path)
-            assert isinstance(loaded.tracks["X"], TrackState)
-            assert loaded.tracks["X"].current_stage == "P1"
-            assert loaded.tracks["X"].label == "test"
-            assert loaded.active_track == "X"
-        finally:
-            os.unlink(tmp_path)
+        loaded = WorkflowState.loads(state.dumps())
+        assert isinstance(loaded.tracks["X"], TrackState)
+        assert loaded == state
+
+    def test_bytes_round_trip_stdlib_json(self, monkeypatch):
+        """Without orjson, dumps() falls back to json with a default= hook."""
+        monkeypatch.setattr(state_module, "HAS_ORJSON", False)
+        state = WorkflowState(
+            checklist=[CheckItem(text="작업", checked=True)],
+            tracks={"X": TrackState(checklist=[CheckItem(text="t")])},
+            active_track="X",
+            phase_graph={"1": PhaseNode(id="1", label="a", module="m")},
+        )
+        assert json.loads(state.dumps()) == state.to_dict()
+        assert WorkflowState.loads(state.dumps()) == state
+
+    def test_saved_file_matches_to_dict(self, tmp_path):
+        """The file written by save() must hold exactly to_dict()."""
+        state = WorkflowState(
+            checklist=[CheckItem(text="task", checked=True)],
+            tracks={"X": TrackState(current_stage="P1", checklist=[CheckItem(text="t")])},
+            phase_graph={"1": PhaseNode(id="1", label="a", module="m", depends_on=["0"])},
+        )
+        path = tmp_path / "state.json"
+        state.save(str(path))
+        assert json.loads(path.read_text(encoding="utf-8")) == state.to_dict()
 
     def test_empty_tracks_not_pollute_existing(self):
         """Adding tracks should not affect existing fields."""
@@ -237,6 +240,8 @@ class TestWorkflowStateTracksExtension:
             checklist=[CheckItem(text="task", checked=True)]
         )
         d = state.to_dict()
+        assert "tracks" not in d
+        assert "active_track" not in d
         restored = WorkflowState.from_dict(d)
         assert restored.current_milestone == "M1"
         assert restored.current_phase == "2.1"
@@ -248,10 +253,37 @@ class TestWorkflowStateTracksExtension:
 # ─── Phase 2.2: Controller Track Management Tests ───
 
 
+def _make_config():
+    """Build the read-only config stub shared by every track-test controller."""
+    return SimpleNamespace(
+        state_file="/tmp/test_state.json",
+        status_file="/tmp/test_status.md",
+        phase_cycle=None,
+        stages={
+            "P1": SimpleNamespace(label="Planning", checklist=[]),
+            "P2": SimpleNamespace(label="Discussion", checklist=[]),
+            "P4": SimpleNamespace(label="Implementation", checklist=[]),
+            "P7": SimpleNamespace(label="Phase Closing", checklist=[]),
+        },
+    )
+
+
+class _AuditSpy:
+    """Records log_event calls in place of AuditLogger's file writes."""
+
+    def __init__(self):
+        self.events = []
+
+    def log_event(self, event_type, data):
+        self.events.append((event_type, data))
+
+
+# Tests never mutate the config, so build it once per module.
+_CONFIG_TEMPLATE = _make_config()
+
+
 def _make_controller():
     """Create a WorkflowController with mocked dependencies for track testing."""
-    from workflow.core.controller import WorkflowController
-
     with patch.object(WorkflowController, '__init__', lambda x: None):
         ctrl = WorkflowController.__new__(WorkflowController)
         ctrl.state = WorkflowState(
@@ -262,71 +294,61 @@ def _make_controller():
             tracks={},
             active_track=None
         )
-        # Mock config
-        ctrl.config = MagicMock()
-        ctrl.config.state_file = "/tmp/test_state.json"
-        ctrl.config.status_file = "/tmp/test_status.md"
-        ctrl.config.stages = {
-            "P1": MagicMock(label="Planning", checklist=[]),
-            "P2": MagicMock(label="Discussion", checklist=[]),
-            "P4": MagicMock(label="Implementation", checklist=[]),
-            "P7": MagicMock(label="Phase Closing", checklist=[]),
-        }
+        ctrl.config = _CONFIG_TEMPLATE
         # Mock engine, parser, context, registry, audit
         ctrl.engine = MagicMock()
-        ctrl.parser = MagicMock()
-        ctrl.parser.extract_checklist.return_value = []
+        ctrl.parser = SimpleNamespace(extract_checklist=lambda *_: [])
         ctrl.context = MagicMock()
         ctrl.context.data = {"active_module": "test-mod"}
         ctrl.registry = MagicMock()
-        ctrl.audit = MagicMock()
-        # Prevent actual file I/O for save
-        ctrl.state.save = MagicMock()
+        ctrl.audit = WorkflowAuditManager.__new__(WorkflowAuditManager)
+        ctrl.audit.logger = _AuditSpy()
         return ctrl
 
 
+@pytest.fixture
+def ctrl():
+    """A fresh mocked controller per test; the config mock is shared."""
+    # Prevent actual file I/O for save (WorkflowState uses __slots__)
+    with patch.object(WorkflowState, 'save'):
+        yield _make_controller()
+
+
 class TestGetEffectiveState:
     """_get_effective_state and _resolve_track_id tests."""
 
-    def test_no_track_returns_global(self):
-        ctrl = _make_controller()
+    def test_no_track_returns_global(self, ctrl):
         effective = ctrl._get_effective_state()
         assert effective is ctrl.state
 
-    def test_explicit_track_returns_track_state(self):
-        ctrl = _make_controller()
+    def test_explicit_track_returns_track_state(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(current_stage="P1", label="Track A")
         effective = ctrl._get_effective_state(track="A")
         assert isinstance(effective, TrackState)
         assert effective.current_stage == "P1"
 
-    def test_active_track_used_when_no_explicit(self):
-        ctrl = _make_controller()
+    def test_active_track_used_when_no_explicit(self, ctrl):
         ctrl.state.tracks["B"] = TrackState(current_stage="P2", label="Track B")
         ctrl.state.active_track = "B"
         effective = ctrl._get_effective_state()
         assert isinstance(effective, TrackState)
         assert effective.current_stage == "P2"
 
-    def test_explicit_track_overrides_active_track(self):
-        ctrl = _make_controller()
+    def test_explicit_track_overrides_active_track(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(current_stage="P1")
         ctrl.state.tracks["B"] = TrackState(current_stage="P2")
         ctrl.state.active_track = "B"
         effective = ctrl._get_effective_state(track="A")
         assert effective.current_stage == "P1"
 
-    def test_nonexistent_track_falls_to_global(self):
-        ctrl = _make_controller()
+    def test_nonexistent_track_falls_to_global(self, ctrl):
         effective = ctrl._get_effective_state(track="Z")
         assert effective is ctrl.state
 
-    def test_resolve_track_id_returns_none_without_track(self):
-        ctrl = _make_controller()
+    def test_resolve_track_id_returns_none_without_track(self, ctrl):
         assert ctrl._resolve_track_id() is None
 
-    def test_resolve_track_id_returns_active_track(self):
-        ctrl = _make_controller()
+    def test_resolve_track_id_returns_active_track(self, ctrl):
         ctrl.state.active_track = "A"
         assert ctrl._resolve_track_id() == "A"
 
@@ -334,8 +356,7 @@ class TestGetEffectiveState:
 class TestTrackCreate:
     """track_create method tests."""
 
-    def test_create_success(self):
-        ctrl = _make_controller()
+    def test_create_success(self, ctrl):
         result = ctrl.track_create("A", label="Test Track", module="viewer", stage="P1")
         assert "A" in ctrl.state.tracks
         assert ctrl.state.tracks["A"].label == "Test Track"
@@ -345,53 +366,52 @@ class TestTrackCreate:
         assert ctrl.state.tracks["A"].checklist == []
         assert "created" in result.lower() or "✅" in result
 
-    def test_create_default_stage(self):
+    def test_create_default_stage(self, ctrl):
         """track_create without stage should default to first config stage."""
-        ctrl = _make_controller()
         result = ctrl.track_create("A", label="Test", module="m")
         assert ctrl.state.tracks["A"].current_stage == "P1"
 
-    def test_create_default_stage_with_none(self):
+    def test_create_default_stage_with_none(self, ctrl):
         """track_create with stage=None should default to first config stage."""
-        ctrl = _make_controller()
         result = ctrl.track_create("A", label="Test", module="m", stage=None)
         assert ctrl.state.tracks["A"].current_stage == "P1"
 
-    def test_create_duplicate_error(self):
-        ctrl = _make_controller()
+    def test_create_default_stage_without_stages(self, ctrl):
+        """With no stages configured, the default stage is a clear ValueError."""
+        ctrl.config = SimpleNamespace(stages={})
+        with pytest.raises(ValueError, match="No stages configured"):
+            ctrl.track_create("A", label="Test", module="m")
+
+    def test_create_duplicate_error(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(label="existing")
         result = ctrl.track_create("A", label="New", module="m")
         assert "already exists" in result.lower() or "❌" in result
 
-    def test_create_invalid_id(self):
-        ctrl = _make_controller()
+    def test_create_invalid_id(self, ctrl):
         result = ctrl.track_create("A B", label="Bad", module="m")
         assert "❌" in result
 
-    def test_create_invalid_stage(self):
-        ctrl = _make_controller()
+    def test_create_invalid_stage(self, ctrl):
         result = ctrl.track_create("A", label="T", module="m", stage="INVALID")
         assert "❌" in result
 
-    def test_create_audit_logged(self):
-        ctrl = _make_controller()
+    def test_create_audit_logged(self, ctrl):
         ctrl.track_create("A", label="T", module="m", stage="P1")
-        ctrl.audit.logger.log_event.assert_called_once()
-        call_args = ctrl.audit.logger.log_event.call_args
-        assert call_args[0][0] == "TRACK_CREATED"
-        assert call_args[0][1]["track"] == "A"
+        events = ctrl.audit.logger.events
+        assert len(events) == 1
+        event_type, data = events[0]
+        assert event_type == "TRACK_CREATED"
+        assert data["track"] == "A"
 
 
 class TestTrackList:
     """track_list method tests."""
 
-    def test_list_empty(self):
-        ctrl = _make_controller()
+    def test_list_empty(self, ctrl):
         result = ctrl.track_list()
         assert "no" in result.lower() or "없" in result
 
-    def test_list_with_tracks(self):
-        ctrl = _make_controller()
+    def test_list_with_tracks(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(current_stage="P1", label="Track A", active_module="viewer")
         ctrl.state.tracks["B"] = TrackState(current_stage="P4", label="Track B", active_module="exec")
         result = ctrl.track_list()
@@ -400,8 +420,7 @@ class TestTrackList:
         assert "Track A" in result
         assert "Track B" in result
 
-    def test_list_shows_active_marker(self):
-        ctrl = _make_controller()
+    def test_list_shows_active_marker(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(label="T")
         ctrl.state.active_track = "A"
         result = ctrl.track_list()
@@ -411,15 +430,13 @@ class TestTrackList:
 class TestTrackSwitch:
     """track_switch method tests."""
 
-    def test_switch_success(self):
-        ctrl = _make_controller()
+    def test_switch_success(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(label="T")
         result = ctrl.track_switch("A")
         assert ctrl.state.active_track == "A"
         assert "✅" in result
 
-    def test_switch_nonexistent(self):
-        ctrl = _make_controller()
+    def test_switch_nonexistent(self, ctrl):
         result = ctrl.track_switch("Z")
         assert "❌" in result
 
@@ -427,22 +444,19 @@ class TestTrackSwitch:
 class TestTrackDelete:
     """track_delete method tests."""
 
-    def test_delete_success(self):
-        ctrl = _make_controller()
+    def test_delete_success(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(label="T")
         result = ctrl.track_delete("A")
         assert "A" not in ctrl.state.tracks
         assert "deleted" in result.lower() or "✅" in result
 
-    def test_delete_clears_active_track(self):
-        ctrl = _make_controller()
+    def test_delete_clears_active_track(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(label="T")
         ctrl.state.active_track = "A"
         ctrl.track_delete("A")
         assert ctrl.state.active_track is None
 
-    def test_delete_nonexistent(self):
-        ctrl = _make_controller()
+    def test_delete_nonexistent(self, ctrl):
         result = ctrl.track_delete("Z")
         assert "❌" in result
 
@@ -450,8 +464,7 @@ class TestTrackDelete:
 class TestTrackJoin:
     """track_join method tests."""
 
-    def test_join_all_complete(self):
-        ctrl = _make_controller()
+    def test_join_all_complete(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(status="complete")
         ctrl.state.tracks["B"] = TrackState(status="complete")
         result = ctrl.track_join()
@@ -459,16 +472,14 @@ class TestTrackJoin:
         assert ctrl.state.active_track is None
         assert "joined" in result.lower() or "✅" in result
 
-    def test_join_incomplete_blocked(self):
-        ctrl = _make_controller()
+    def test_join_incomplete_blocked(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(status="complete")
         ctrl.state.tracks["B"] = TrackState(status="in_progress", label="B track")
         result = ctrl.track_join()
         assert len(ctrl.state.tracks) == 2  # Not cleared
         assert "❌" in result
 
-    def test_join_no_tracks(self):
-        ctrl = _make_controller()
+    def test_join_no_tracks(self, ctrl):
         result = ctrl.track_join()
         assert "no" in result.lower() or "없" in result
 
@@ -476,8 +487,7 @@ class TestTrackJoin:
 class TestTrackScopedCheck:
     """check() with track parameter tests."""
 
-    def test_check_on_track(self):
-        ctrl = _make_controller()
+    def test_check_on_track(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P4",
             checklist=[CheckItem(text="impl code", checked=False)]
@@ -486,13 +496,11 @@ class TestTrackScopedCheck:
         assert ctrl.state.tracks["A"].checklist[0].checked is True
         assert "impl code" in result
 
-    def test_check_nonexistent_track_error(self):
-        ctrl = _make_controller()
+    def test_check_nonexistent_track_error(self, ctrl):
         result = ctrl.check([1], track="Z")
         assert "❌" in result
 
-    def test_check_on_global_when_no_track(self):
-        ctrl = _make_controller()
+    def test_check_on_global_when_no_track(self, ctrl):
         ctrl.state.checklist = [CheckItem(text="global item", checked=False)]
         result = ctrl.check([1])
         assert ctrl.state.checklist[0].checked is True
@@ -501,8 +509,7 @@ class TestTrackScopedCheck:
 class TestTrackScopedNextStage:
     """next_stage() with track parameter tests."""
 
-    def test_next_on_track_transitions(self):
-        ctrl = _make_controller()
+    def test_next_on_track_transitions(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P1",
             checklist=[CheckItem(text="done", checked=True)]
@@ -518,8 +525,7 @@ class TestTrackScopedNextStage:
         assert ctrl.state.tracks["A"].current_stage == "P2"
         assert "P2" in result
 
-    def test_next_track_completes_when_no_transitions(self):
-        ctrl = _make_controller()
+    def test_next_track_completes_when_no_transitions(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P7",
             checklist=[CheckItem(text="done", checked=True)]
@@ -534,8 +540,7 @@ class TestTrackScopedNextStage:
 class TestTrackScopedSetModule:
     """set_module() with track parameter tests."""
 
-    def test_set_module_on_track(self):
-        ctrl = _make_controller()
+    def test_set_module_on_track(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P4",
             active_module="old-mod",
@@ -546,8 +551,7 @@ class TestTrackScopedSetModule:
         assert ctrl.state.tracks["A"].active_module == "new-mod"
         assert "new-mod" in result
 
-    def test_set_module_on_global(self):
-        ctrl = _make_controller()
+    def test_set_module_on_global(self, ctrl):
         ctrl.engine.current_stage = ctrl.config.stages["P4"]
         result = ctrl.set_module("new-mod")
         assert ctrl.state.active_module == "new-mod"
@@ -556,23 +560,20 @@ class TestTrackScopedSetModule:
 class TestStatusModes:
     """status() 3-mode tests."""
 
-    def test_status_global_without_tracks(self):
-        ctrl = _make_controller()
+    def test_status_global_without_tracks(self, ctrl):
         ctrl.engine.current_stage = ctrl.config.stages["P4"]
         result = ctrl.status()
         assert "P4" in result
         # No track warning
         assert "parallel" not in result.lower()
 
-    def test_status_global_with_tracks_shows_warning(self):
-        ctrl = _make_controller()
+    def test_status_global_with_tracks_shows_warning(self, ctrl):
         ctrl.engine.current_stage = ctrl.config.stages["P4"]
         ctrl.state.tracks["A"] = TrackState(label="T")
         result = ctrl.status()
         assert "track" in result.lower()
 
-    def test_status_single_track(self):
-        ctrl = _make_controller()
+    def test_status_single_track(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P1",
             active_module="viewer",
@@ -584,13 +585,11 @@ class TestStatusModes:
         assert "Track A" in result
         assert "P1" in result
 
-    def test_status_nonexistent_track_error(self):
-        ctrl = _make_controller()
+    def test_status_nonexistent_track_error(self, ctrl):
         result = ctrl.status(track="Z")
         assert "❌" in result
 
-    def test_status_all_tracks(self):
-        ctrl = _make_controller()
+    def test_status_all_tracks(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P1", label="Track A", active_module="viewer",
             checklist=[CheckItem(text="x", checked=True)]
@@ -608,8 +607,7 @@ class TestStatusModes:
 class TestBackwardCompatibility:
     """Ensure existing functionality works when no tracks are used."""
 
-    def test_check_without_track_works(self):
-        ctrl = _make_controller()
+    def test_check_without_track_works(self, ctrl):
         ctrl.state.checklist = [
             CheckItem(text="item1", checked=False),
             CheckItem(text="item2", checked=False)
@@ -618,8 +616,7 @@ class TestBackwardCompatibility:
         assert ctrl.state.checklist[0].checked is True
         assert ctrl.state.checklist[1].checked is True
 
-    def test_next_without_track_works(self):
-        ctrl = _make_controller()
+    def test_next_without_track_works(self, ctrl):
         ctrl.state.checklist = [CheckItem(text="done", checked=True)]
         transition = MagicMock()
         transition.target = "P2"
@@ -631,8 +628,7 @@ class TestBackwardCompatibility:
         result = ctrl.next_stage()
         assert ctrl.state.current_stage == "P2"
 
-    def test_set_module_without_track_works(self):
-        ctrl = _make_controller()
+    def test_set_module_without_track_works(self, ctrl):
         ctrl.engine.current_stage = ctrl.config.stages["P4"]
         ctrl.set_module("new-mod")
         assert ctrl.state.active_module == "new-mod"
@@ -641,24 +637,20 @@ class TestBackwardCompatibility:
 class TestTrackJoinForce:
     """track_join --force security tests."""
 
-    def test_force_join_without_token_rejected(self):
-        ctrl = _make_controller()
+    def test_force_join_without_token_rejected(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(status="in_progress")
         result = ctrl.track_join(force=True)
         assert "❌" in result
         assert len(ctrl.state.tracks) == 1  # Not cleared
 
-    def test_force_join_with_invalid_token_rejected(self):
-        from workflow.core.controller import verify_token
-        ctrl = _make_controller()
+    def test_force_join_with_invalid_token_rejected(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(status="in_progress")
         with patch('workflow.core.controller.verify_token', return_value=False):
             result = ctrl.track_join(force=True, token="BAD")
         assert "❌" in result
         assert len(ctrl.state.tracks) == 1
 
-    def test_force_join_with_valid_token_succeeds(self):
-        ctrl = _make_controller()
+    def test_force_join_with_valid_token_succeeds(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(status="in_progress")
         with patch('workflow.core.controller.verify_token', return_value=True):
             result = ctrl.track_join(force=True, token="VALID")
@@ -669,8 +661,7 @@ class TestTrackJoinForce:
 class TestTrackScopedUncheck:
     """uncheck() with track parameter tests."""
 
-    def test_uncheck_on_track(self):
-        ctrl = _make_controller()
+    def test_uncheck_on_track(self, ctrl):
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P4",
             checklist=[CheckItem(text="item1", checked=True)]
@@ -678,8 +669,7 @@ class TestTrackScopedUncheck:
         result = ctrl.uncheck([1], track="A")
         assert ctrl.state.tracks["A"].checklist[0].checked is False
 
-    def test_uncheck_nonexistent_track_error(self):
-        ctrl = _make_controller()
+    def test_uncheck_nonexistent_track_error(self, ctrl):
         result = ctrl.uncheck([1], track="Z")
         assert "❌" in result
 
@@ -690,9 +680,8 @@ class TestTrackScopedUncheck:
 class TestSetStageTrackScoped:
     """set_stage() with track parameter tests."""
 
-    def test_set_stage_on_track(self):
+    def test_set_stage_on_track(self, ctrl):
         """set_stage should change the track's stage, not global."""
-        ctrl = _make_controller()
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P1",
             active_module="viewer",
@@ -702,9 +691,8 @@ class TestSetStageTrackScoped:
         assert ctrl.state.tracks["A"].current_stage == "P2"
         assert ctrl.state.current_stage == "P4"  # Global unchanged
 
-    def test_set_stage_on_track_with_module(self):
+    def test_set_stage_on_track_with_module(self, ctrl):
         """set_stage with module should update track's module."""
-        ctrl = _make_controller()
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P1",
             active_module="viewer",
@@ -714,9 +702,8 @@ class TestSetStageTrackScoped:
         assert ctrl.state.tracks["A"].active_module == "new-mod"
         assert "new-mod" in result
 
-    def test_set_stage_track_clears_checklist(self):
+    def test_set_stage_track_clears_checklist(self, ctrl):
         """set_stage should clear track's checklist."""
-        ctrl = _make_controller()
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P1",
             checklist=[CheckItem(text="item", checked=True)]
@@ -724,15 +711,13 @@ class TestSetStageTrackScoped:
         result = ctrl.set_stage("P2", track="A")
         assert ctrl.state.tracks["A"].checklist == []
 
-    def test_set_stage_nonexistent_track_error(self):
+    def test_set_stage_nonexistent_track_error(self, ctrl):
         """set_stage on non-existent track should return error."""
-        ctrl = _make_controller()
         result = ctrl.set_stage("P2", track="Z")
         assert "❌" in result
 
-    def test_set_stage_track_with_unchecked_items_blocked(self):
+    def test_set_stage_track_with_unchecked_items_blocked(self, ctrl):
         """set_stage should block when track has unchecked items without --force."""
-        ctrl = _make_controller()
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P1",
             checklist=[CheckItem(text="unchecked item", checked=False)]
@@ -740,9 +725,8 @@ class TestSetStageTrackScoped:
         result = ctrl.set_stage("P2", track="A")
         assert "unchecked" in result.lower() or "미완료" in result
 
-    def test_set_stage_track_force_with_token(self):
+    def test_set_stage_track_force_with_token(self, ctrl):
         """set_stage --force on track with valid token should succeed."""
-        ctrl = _make_controller()
         ctrl.state.tracks["A"] = TrackState(
             current_stage="P1",
             checklist=[CheckItem(text="unchecked", checked=False)]
@@ -751,77 +735,90 @@ class TestSetStageTrackScoped:
             result = ctrl.set_stage("P2", force=True, token="VALID", track="A")
         assert ctrl.state.tracks["A"].current_stage == "P2"
 
-    def test_set_stage_via_active_track(self):
+    def test_set_stage_via_active_track(self, ctrl):
         """set_stage without explicit track should use active_track."""
-        ctrl = _make_controller()
         ctrl.state.tracks["A"] = TrackState(current_stage="P1", checklist=[])
         ctrl.state.active_track = "A"
         result = ctrl.set_stage("P2")
         assert ctrl.state.tracks["A"].current_stage == "P2"
 
-    def test_set_stage_invalid_stage(self):
+    def test_set_stage_invalid_stage(self, ctrl):
         """set_stage with invalid stage code should fail regardless of track."""
-        ctrl = _make_controller()
         ctrl.state.tracks["A"] = TrackState(current_stage="P1", checklist=[])
         result = ctrl.set_stage("INVALID", track="A")
         assert "❌" in result
 
 
+# (name-or-flags, kwargs) per argument, keyed by subcommand.
+_TRACK_ARGS = {
+    "create": [
+        (("id",), {}),
+        (("--label",), {"required": True}),
+        (("--module",), {"required": True}),
+        (("--stage",), {}),
+    ],
+    "list": [],
+    "switch": [(("id",), {})],
+    "join": [
+        (("--force",), {"action": "store_true"}),
+        (("--token", "-k"), {}),
+    ],
+    "delete": [(("id",), {})],
+}
+_SUBCOMMANDS = {
+    "status": [
+        (("--track",), {}),
+        (("--all",), {"action": "store_true", "dest": "all_tracks"}),
+    ],
+    "check": [(("indices",), {"type": int, "nargs": "*"}), (("--track",), {})],
+    "next": [(("target",), {"nargs": "?"}), (("--track",), {})],
+    "set": [(("stage",), {}), (("--track",), {})],
+    "uncheck": [(("indices",), {"type": int, "nargs": "+"}), (("--track",), {})],
+    "track": _TRACK_ARGS,  # nested subcommand group
+}
+
+
+def _add_subcommand(subparsers, name, spec):
+    sub = subparsers.add_parser(name)
+    if isinstance(spec, dict):
+        group = sub.add_subparsers(dest=f"{name}_command")
+        for child, child_spec in spec.items():
+            _add_subcommand(group, child, child_spec)
+        return
+    for flags, kwargs in spec:
+        sub.add_argument(*flags, **kwargs)
+
+
+def _sniff_subcommand(args_list):
+    """Return the first non-option token if it names a known subcommand."""
+    for arg in args_list:
+        if not arg.startswith("-"):
+            return arg if arg in _SUBCOMMANDS else None
+    return None
+
+
+@functools.cache
+def _track_cli_parser(command=None):
+    """Mirror of the CLI's track-related argparse tree.
+
+    Only the subparser for ``command`` is built; ``None`` builds them all
+    (e.g. for --help). Each variant is cached after first use.
+    """
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command")
+    names = _SUBCOMMANDS if command is None else (command,)
+    for name in names:
+        _add_subcommand(subparsers, name, _SUBCOMMANDS[name])
+    return parser
+
+
 class TestCLITrackArgParsing:
     """Test that CLI argparse correctly parses track-related arguments."""
 
     def _parse_args(self, args_list):
         """Helper to parse args using the CLI's argument parser."""
-        import argparse
-        from workflow.i18n import t, set_language
         set_language("en")
-
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers(dest="command")
-
-        # status
-        sp = subparsers.add_parser("status")
-        sp.add_argument("--track")
-        sp.add_argument("--all", action="store_true", dest="all_tracks")
-
-        # check
-        cp = subparsers.add_parser("check")
-        cp.add_argument("indices", type=int, nargs="*")
-        cp.add_argument("--track")
-
-        # next
-        np = subparsers.add_parser("next")
-        np.add_argument("target", nargs="?")
-        np.add_argument("--track")
-
-        # set
-        setp = subparsers.add_parser("set")
-        setp.add_argument("stage")
-        setp.add_argument("--track")
-
-        # uncheck
-        up = subparsers.add_parser("uncheck")
-        up.add_argument("indices", type=int, nargs="+")
-        up.add_argument("--track")
-
-        # track subcommand group
-        tp = subparsers.add_parser("track")
-        tsub = tp.add_subparsers(dest="track_command")
-        tc = tsub.add_parser("create")
-        tc.add_argument("id")
-        tc.add_argument("--label", required=True)
-        tc.add_argument("--module", required=True)
-        tc.add_argument("--stage")
-        tsub.add_parser("list")
-        ts = tsub.add_parser("switch")
-        ts.add_argument("id")
-        tj = tsub.add_parser("join")
-        tj.add_argument("--force", action="store_true")
-        tj.add_argument("--token", "-k")
-        td = tsub.add_parser("delete")
-        td.add_argument("id")
-
-        return parser.parse_args(args_list)
+        return _track_cli_parser(_sniff_subcommand(args_list)).parse_args(args_list)
 
     def test_status_track_option(self):
         args = self._parse_args(["status", "--track", "A"])
@@ -1024,7 +1021,7 @@ class TestWorkflowStatePhaseGraph:
         assert len(restored.phase_graph) == 1
         assert restored.tracks["A"].created_by == "manual"
 
-    def test_save_load_round_trip_with_phase_graph(self):
+    def test_save_load_round_trip_with_phase_graph(self, tmp_path):
         """Full file persistence round-trip."""
         state = WorkflowState(
             current_milestone="M11",
@@ -1036,17 +1033,13 @@ class TestWorkflowStatePhaseGraph:
                 "A": TrackState(label="Phase 2", phase_id="2", created_by="auto"),
             }
         )
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            path = f.name
-        try:
-            state.save(path)
-            loaded = WorkflowState.load(path)
-            assert len(loaded.phase_graph) == 2
-            assert loaded.phase_graph["2"].depends_on == ["1"]
-            assert loaded.tracks["A"].phase_id == "2"
-            assert loaded.tracks["A"].created_by == "auto"
-        finally:
-            os.remove(path)
+        path = str(tmp_path / "state.json")
+        state.save(path)
+        loaded = WorkflowState.load(path)
+        assert len(loaded.phase_graph) == 2
+        assert loaded.phase_graph["2"].depends_on == ["1"]
+        assert loaded.tracks["A"].phase_id == "2"
+        assert loaded.tracks["A"].created_by == "auto"
 
 
 class TestTrackStateV2Extensions:
@@ -1087,5 +1080,4 @@ class TestTrackStateV2Extensions:
             label="Phase 2", phase_id="2", created_by="auto"
         )
         restored = TrackState.from_dict(original.to_dict())
-        assert restored.phase_id == original.phase_id
-        assert restored.created_by == original.created_by
+        assert restored == original
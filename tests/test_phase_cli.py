@@ -1,50 +1,56 @@
 """Tests for Phase DAG CLI — controller methods and CLI integration."""
 
+import itertools
 import pytest
 import json
 import os
 import subprocess
 import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
-from workflow.core.state import WorkflowState, PhaseNode
+from workflow.core.state import PhaseNode
 
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
-def _make_controller():
-    """Create a WorkflowController with mocked dependencies."""
-    ctrl = MagicMock()
-    ctrl.state = MagicMock(spec=WorkflowState)
-    ctrl.state.phase_graph = {}
-    ctrl.state.tracks = {}
-    ctrl.state.active_track = None
-    ctrl.config = MagicMock()
-    ctrl.config.state_file = ".workflow/state.json"
-    ctrl.audit = MagicMock()
-    ctrl.audit.logger = MagicMock()
+def _make_controller(*methods):
+    """Create a controller stand-in exposing only what phase_* methods use.
+
+    Each name in ``methods`` is bound from WorkflowController onto it.
+    """
+    ctrl = SimpleNamespace(
+        state=SimpleNamespace(
+            phase_graph={}, tracks={}, active_track=None, save=MagicMock()
+        ),
+        config=SimpleNamespace(state_file=".workflow/state.json"),
+        audit=SimpleNamespace(logger=SimpleNamespace(log_event=MagicMock())),
+    )
+    for name in methods:
+        setattr(ctrl, name, _CTRL_METHODS[name].__get__(ctrl))
     return ctrl
 
 
 def _add_node(graph, id, label="Test", module="m", depends_on=None, status="pending"):
     """Add a PhaseNode to a graph dict."""
-    graph[id] = PhaseNode(
-        id=id, label=label, module=module,
-        depends_on=depends_on or [], status=status
-    )
+    graph[id] = PhaseNode(id, label, module, depends_on or [], status)
 
 
 # ── Import actual controller methods ─────────────────────────────────
 
 from workflow.core.controller import WorkflowController
 
+# Unbound controller methods under test, looked up once.
+_CTRL_METHODS = {
+    name: getattr(WorkflowController, name)
+    for name in ("phase_add", "phase_list", "phase_graph", "phase_remove")
+}
+
 
 # ━━ Controller: phase_add ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 class TestPhaseAdd:
     def _make_ctrl(self):
-        ctrl = _make_controller()
-        ctrl.phase_add = WorkflowController.phase_add.__get__(ctrl)
-        return ctrl
+        return _make_controller("phase_add")
 
     def test_add_single_node(self):
         ctrl = self._make_ctrl()
@@ -79,31 +85,14 @@ class TestPhaseAdd:
     def test_cycle_detection_via_validate_dag(self):
         """Adding a node that creates a cycle should fail and rollback."""
         ctrl = self._make_ctrl()
-        # Build: 1 → 2 (already exists)
-        _add_node(ctrl.state.phase_graph, "1")
-        _add_node(ctrl.state.phase_graph, "2", depends_on=["1"])
-        # Now add "3" depends on "2", then manually create cycle: "1" depends on "3"
-        # The cycle is: 1 -> 2 -> 3 -> 1 (created by manipulating "1" after add)
-        # Instead, pre-build a graph with 1 depending on 2, then add via phase_add
-        ctrl2 = self._make_ctrl()
-        _add_node(ctrl2.state.phase_graph, "1", depends_on=["2"])
-        _add_node(ctrl2.state.phase_graph, "2")
-        # Graph already has 1 -> 2. Now add "2" depending on "1" would cycle,
-        # but "2" exists. So let's add "3" that depends on "1", then make "2" depend on "3"
-        # Simpler: pre-set graph so adding new node creates cycle.
-        ctrl3 = self._make_ctrl()
-        _add_node(ctrl3.state.phase_graph, "a", depends_on=["b"])
-        _add_node(ctrl3.state.phase_graph, "b")
-        # Now add "c" depending on "a", then "b" depending on "c" → cycle
-        # Actually: just add "c" where "b" depends on "c" and "c" depends on "a"
-        # Rebuild: a ← b, and add c: b → c → a → b = cycle
-        ctrl3.state.phase_graph["b"].depends_on = ["a"]  # b depends on a
-        # Now a depends on b, b depends on a → already a cycle
+        # Pre-existing cycle: a depends on b, b depends on a
+        _add_node(ctrl.state.phase_graph, "a", depends_on=["b"])
+        _add_node(ctrl.state.phase_graph, "b", depends_on=["a"])
         # Adding any new node to this broken graph should detect the cycle
-        result = ctrl3.phase_add("c", "New", "m", depends_on=["b"])
+        result = ctrl.phase_add("c", "New", "m", depends_on=["b"])
         assert "Cycle" in result or "invalid DAG" in result
-        assert "c" not in ctrl3.state.phase_graph  # rollback
-        ctrl3.state.save.assert_not_called()
+        assert "c" not in ctrl.state.phase_graph  # rollback
+        ctrl.state.save.assert_not_called()
 
     def test_self_referencing_dependency_rejected(self):
         """A node depending on itself via depends_on that doesn't exist yet."""
@@ -127,9 +116,7 @@ class TestPhaseAdd:
 
 class TestPhaseList:
     def _make_ctrl(self):
-        ctrl = _make_controller()
-        ctrl.phase_list = WorkflowController.phase_list.__get__(ctrl)
-        return ctrl
+        return _make_controller("phase_list")
 
     def test_empty_graph(self):
         ctrl = self._make_ctrl()
@@ -151,9 +138,10 @@ class TestPhaseList:
         _add_node(ctrl.state.phase_graph, "1", "First")
         _add_node(ctrl.state.phase_graph, "2", "Second", depends_on=["1"])
         result = ctrl.phase_list()
-        lines = result.split("\n")
-        # Find data lines (after header + separator)
-        data_lines = [l for l in lines if l.startswith("[")]
+        # Find data lines (after header + separator); a 4th would fail the len check
+        data_lines = list(itertools.islice(
+            (l for l in result.split("\n") if l.startswith("[")), 4
+        ))
         assert len(data_lines) == 3
         assert data_lines[0].startswith("[1]")
         assert data_lines[1].startswith("[2]")
@@ -171,9 +159,7 @@ class TestPhaseList:
 
 class TestPhaseGraph:
     def _make_ctrl(self):
-        ctrl = _make_controller()
-        ctrl.phase_graph = WorkflowController.phase_graph.__get__(ctrl)
-        return ctrl
+        return _make_controller("phase_graph")
 
     def test_empty_graph(self):
         ctrl = self._make_ctrl()
@@ -222,9 +208,7 @@ class TestPhaseGraph:
 
 class TestPhaseRemove:
     def _make_ctrl(self):
-        ctrl = _make_controller()
-        ctrl.phase_remove = WorkflowController.phase_remove.__get__(ctrl)
-        return ctrl
+        return _make_controller("phase_remove")
 
     def test_remove_existing(self):
         ctrl = self._make_ctrl()
@@ -262,72 +246,73 @@ class TestPhaseRemove:
 
 # ━━ CLI Integration (subprocess) ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+def _clear_phase_graph(state_file):
+    """Reset phase_graph in the current state file, keeping everything else."""
+    if os.path.exists(state_file):
+        with open(state_file, 'r') as f:
+            data = json.load(f)
+        data["phase_graph"] = {}
+        with open(state_file, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+@pytest.mark.xdist_group("state_file")
 class TestCLIIntegration:
     """Integration tests running actual CLI commands."""
 
     @pytest.fixture(autouse=True)
     def setup_clean_state(self):
         """Ensure phase_graph is clean before/after each test."""
-        # Read current state and clear phase_graph
         state_file = ".workflow/state.json"
-        if os.path.exists(state_file):
-            with open(state_file, 'r') as f:
-                data = json.load(f)
-            data["phase_graph"] = {}
-            with open(state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+        _clear_phase_graph(state_file)
         yield
         # Cleanup
-        if os.path.exists(state_file):
-            with open(state_file, 'r') as f:
-                data = json.load(f)
-            data["phase_graph"] = {}
-            with open(state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+        _clear_phase_graph(state_file)
 
     def _run(self, *args):
+        # Output stays as bytes; the assertions only test ASCII substrings.
         result = subprocess.run(
             [sys.executable, "-m", "workflow.cli"] + list(args),
-            capture_output=True, text=True, timeout=10
+            capture_output=True, timeout=10
         )
         return result.stdout.strip(), result.returncode
 
     def test_phase_list_empty(self):
         out, _ = self._run("phase", "list")
-        assert "No phases" in out
+        assert b"No phases" in out
 
     def test_phase_add_and_list(self):
         out, _ = self._run("phase", "add", "1", "--label", "Test Phase", "--module", "test-mod")
-        assert "1" in out
-        assert "Test Phase" in out
+        assert b"1" in out
+        assert b"Test Phase" in out
 
         out, _ = self._run("phase", "list")
-        assert "[1]" in out
-        assert "Test Phase" in out
+        assert b"[1]" in out
+        assert b"Test Phase" in out
 
     def test_phase_graph(self):
         self._run("phase", "add", "1", "--label", "Root", "--module", "m")
         self._run("phase", "add", "2", "--label", "Child", "--module", "m", "--depends-on", "1")
         out, _ = self._run("phase", "graph")
-        assert "Level 0" in out
-        assert "Level 1" in out
+        assert b"Level 0" in out
+        assert b"Level 1" in out
 
     def test_phase_remove(self):
         self._run("phase", "add", "1", "--label", "Root", "--module", "m")
         out, _ = self._run("phase", "remove", "1")
-        assert "removed" in out
+        assert b"removed" in out
 
     def test_phase_remove_blocked(self):
         self._run("phase", "add", "1", "--label", "Root", "--module", "m")
         self._run("phase", "add", "2", "--label", "Child", "--module", "m", "--depends-on", "1")
         out, _ = self._run("phase", "remove", "1")
-        assert "Cannot remove" in out or "depended on" in out
+        assert b"Cannot remove" in out or b"depended on" in out
 
     def test_phase_add_duplicate(self):
         self._run("phase", "add", "1", "--label", "A", "--module", "m")
         out, _ = self._run("phase", "add", "1", "--label", "B", "--module", "m")
-        assert "already exists" in out
+        assert b"already exists" in out
 
     def test_phase_add_invalid_dep(self):
         out, _ = self._run("phase", "add", "1", "--label", "A", "--module", "m", "--depends-on", "99")
-        assert "does not exist" in out
+        assert b"does not exist" in out
@@ -1,5 +1,6 @@
 """Tests for workflow plugins."""
 import os
+import subprocess
 import sys
 import pytest
 from workflow.plugins.shell import CommandValidator
@@ -7,6 +8,15 @@ from workflow.plugins.fs import FileExistsValidator
 from workflow.core.context import WorkflowContext
 
 
+def _fake_runner(returncode=0, calls=None):
+    """Stand-in for subprocess.run that records calls instead of spawning a shell."""
+    def run(cmd, **kwargs):
+        if calls is not None:
+            calls.append((cmd, kwargs))
+        return subprocess.CompletedProcess(cmd, returncode)
+    return run
+
+
 class TestCommandValidator:
     """Test CommandValidator plugin."""
 
@@ -19,48 +29,64 @@ class TestCommandValidator:
 
     def test_simple_command_failure(self):
         """Command that exits non-zero should return False."""
-        validator = CommandValidator()
+        validator = CommandValidator(runner=_fake_runner(returncode=1))
         ctx = WorkflowContext()
         result = validator.validate({"cmd": "exit 1"}, ctx.data)
         assert result is False
 
     def test_expect_non_zero_code(self):
         """expect_code parameter should work."""
-        validator = CommandValidator()
+        validator = CommandValidator(runner=_fake_runner(returncode=1))
         ctx = WorkflowContext()
         result = validator.validate({"cmd": "exit 1", "expect_code": 1}, ctx.data)
         assert result is True
 
     def test_variable_resolution(self):
         """Variables in command should be resolved."""
-        validator = CommandValidator()
+        calls = []
+        validator = CommandValidator(runner=_fake_runner(calls=calls))
         ctx = WorkflowContext()
         # ${python} should resolve to current Python
         result = validator.validate({"cmd": "${python} --version"}, ctx.data)
         assert result is True
+        assert calls[0][0] == f"{sys.executable} --version"
 
     def test_nested_variable_resolution(self):
         """Nested variables should be resolved."""
-        validator = CommandValidator()
+        calls = []
+        validator = CommandValidator(runner=_fake_runner(calls=calls))
         ctx = WorkflowContext()
         ctx.data["my_cmd"] = "${python} --version"
         result = validator.validate({"cmd": "${my_cmd}"}, ctx.data)
         assert result is True
+        assert calls[0][0] == f"{sys.executable} --version"
 
-    def test_environment_inherited(self):
-        """Current environment should be inherited."""
-        validator = CommandValidator()
+    def test_environment_passed_to_runner(self):
+        """The runner should be handed the current environment."""
+        calls = []
+        validator = CommandValidator(runner=_fake_runner(calls=calls))
         ctx = WorkflowContext()
 
         # Set a unique env var
         os.environ["_WORKFLOW_TEST_VAR"] = "test_value_123"
         try:
-            # Command should be able to see it
-            result = validator.validate(
-                {"cmd": "test \"$_WORKFLOW_TEST_VAR\" = \"test_value_123\""},
-                ctx.data
-            )
+            result = validator.validate({"cmd": "true"}, ctx.data)
             assert result is True
+            # Command should be able to see it
+            assert calls[0][1]["env"]["_WORKFLOW_TEST_VAR"] == "test_value_123"
+        finally:
+            del os.environ["_WORKFLOW_TEST_VAR"]
+
+    def test_environment_inherited(self):
+        """A real child process should see the current environment."""
+        validator = CommandValidator()
+        ctx = WorkflowContext()
+
+        os.environ["_WORKFLOW_TEST_VAR"] = "test_value_123"
+        try:
+            cmd = ("${python} -c \"import os, sys; "
+                   "sys.exit(os.environ.get('_WORKFLOW_TEST_VAR') != 'test_value_123')\"")
+            assert validator.validate({"cmd": cmd}, ctx.data) is True
         finally:
             del os.environ["_WORKFLOW_TEST_VAR"]
 
@@ -129,3 +155,12 @@ class TestFileExistsValidator:
             ctx.data
         )
         assert result is True
+
+    def test_not_empty_rejects_empty_file(self, tmp_path):
+        """not_empty should fail for an existing but empty file."""
+        empty = tmp_path / "empty.txt"
+        empty.write_text("")
+        validator = FileExistsValidator()
+        ctx = WorkflowContext()
+        assert validator.validate({"path": str(empty)}, ctx.data) is True
+        assert validator.validate({"path": str(empty), "not_empty": True}, ctx.data) is False
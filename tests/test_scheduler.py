@@ -158,6 +158,12 @@ class TestMarkComplete:
         newly = PhaseScheduler.mark_complete(diamond_graph, "3")
         assert [n.id for n in newly] == ["4"]
 
+    def test_unrelated_available_not_reported(self):
+        """Phases that were already available are not returned again."""
+        g = _graph(_node("1", status="active"), _node("2", ["1"]), _node("5"))
+        newly = PhaseScheduler.mark_complete(g, "1")
+        assert [n.id for n in newly] == ["2"]
+
     def test_not_found_raises_keyerror(self):
         with pytest.raises(KeyError, match="Phase 'x' not found"):
             PhaseScheduler.mark_complete({}, "x")
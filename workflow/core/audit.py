@@ -8,7 +8,9 @@ from typing import List, Dict, Any
 class AuditLogger:
     def __init__(self, log_dir: str = ".workflow/audit"):
         self.log_dir = log_dir
-        os.makedirs(log_dir, exist_ok=True)
+        # The dir normally exists already; one stat is cheaper than a failing mkdir
+        if not os.path.isdir(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
         self.log_file = os.path.join(log_dir, "workflow.log")
 
     def log_event(self, event_type: str, data: Dict[str, Any]):
@@ -1,13 +1,17 @@
 import ast
+import operator
 import os
 import re
 import sys
-from typing import Any, Dict, List, Union, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Union, Optional
+
+_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
 
 class ContextResolver:
     def __init__(self, context_data: Dict[str, Any]):
         self.context = context_data
-        self._var_pattern = re.compile(r'\$\{([^}]+)\}')
+        self._var_pattern = _VAR_PATTERN
 
     def resolve(self, data: Any) -> Any:
         """
@@ -22,6 +26,8 @@ class ContextResolver:
         return data
 
     def _resolve_string(self, text: str) -> str:
+        if '${' not in text:
+            return text
         # Loop to support variables within variables (e.g. ${module_path} containing ${active_module})
         max_depth = 5
         current_text = text
@@ -71,6 +77,82 @@ class WorkflowContext:
         return ContextResolver(self.data)
 
 
+# Checked in this order: ' not in ' must be tried before ' in '
+_WHEN_OPS = (
+    (' not in ', lambda left, right: left not in right, True),
+    (' in ', lambda left, right: left in right, True),
+    (' != ', operator.ne, False),
+    (' == ', operator.eq, False),
+)
+
+
+def _parse_when_value(s: str) -> Any:
+    """Parse a single value (string literal or bare word)."""
+    s = s.strip()
+    try:
+        return ast.literal_eval(s)
+    except (ValueError, SyntaxError):
+        return s  # Bare word, e.g. user-auth or feature/x
+
+
+def _parse_when_list(s: str) -> list:
+    """Parse a list literal like ['a', 'b', 'c']."""
+    s = s.strip()
+    try:
+        result = ast.literal_eval(s)
+    except (ValueError, SyntaxError):
+        raise ValueError(f"Invalid list syntax: {s}")
+    if isinstance(result, (list, tuple, set)):
+        return list(result)
+    return [result]  # Single value - wrap in list
+
+
+def _when_literal(value: Any) -> str:
+    """Quote a variable value so it parses back as a string; None is empty."""
+    return '""' if value is None else repr(str(value))
+
+
+def _compile_operand(text: str, parse: Callable[[str], Any]) -> Callable[[Dict[str, Any]], Any]:
+    """Compile one side of a comparison into a function of the context."""
+    text = text.strip()
+    if parse is _parse_when_value:
+        match = _VAR_PATTERN.fullmatch(text)
+        if match:
+            name = match.group(1)
+
+            def lookup(ctx: Dict[str, Any]) -> str:
+                value = ctx.get(name)
+                return "" if value is None else str(value)
+            return lookup
+
+    if not _VAR_PATTERN.search(text):
+        value = parse(text)
+        return lambda ctx: value
+
+    def resolve(ctx: Dict[str, Any]) -> Any:
+        return parse(_VAR_PATTERN.sub(lambda m: _when_literal(ctx.get(m.group(1))), text))
+    return resolve
+
+
+@lru_cache(maxsize=256)
+def _compile_when(expression: str) -> Callable[[Dict[str, Any]], bool]:
+    """Compile a when expression once into a function of the context.
+
+    The expression is split on the first supported operator and each side
+    is parsed as a literal, falling back to a bare word. Constant operands
+    are parsed here; operands with ${var} references are resolved per call.
+    """
+    for token, compare, list_operand in _WHEN_OPS:
+        if token in expression:
+            left_text, right_text = expression.split(token, 1)
+            left = _compile_operand(left_text, _parse_when_value)
+            right = _compile_operand(
+                right_text, _parse_when_list if list_operand else _parse_when_value)
+            return lambda ctx: compare(left(ctx), right(ctx))
+
+    raise ValueError(f"Invalid when expression: {expression}")
+
+
 class WhenEvaluator:
     """
     Evaluates simple conditional expressions for the 'when' clause.
@@ -81,93 +163,16 @@ class WhenEvaluator:
     - ${var} in ["a", "b", "c"]
     - ${var} not in ["a", "b", "c"]
 
-    For safety, this uses a simple parser instead of eval().
+    For safety, this uses a simple parser instead of eval(). Compiled
+    expressions are cached.
     """
 
     def __init__(self, context_data: Dict[str, Any]):
         self.context = context_data
-        self._var_pattern = re.compile(r'\$\{([^}]+)\}')
 
     def evaluate(self, expression: str) -> bool:
         """Evaluate a when expression and return True/False."""
         if not expression or not expression.strip():
             return True  # Empty expression = always true
 
-        expr = expression.strip()
-
-        # Resolve variables first
-        resolved = self._resolve_variables(expr)
-
-        # Parse and evaluate
-        return self._evaluate_expression(resolved)
-
-    def _resolve_variables(self, expr: str) -> str:
-        """Replace ${var} with actual values, quoted as strings."""
-        def replacer(match):
-            var_name = match.group(1)
-            value = self.context.get(var_name)
-            if value is None:
-                return '""'  # Treat None as empty string
-            # Return as quoted string for safe parsing
-            return repr(str(value))
-
-        return self._var_pattern.sub(replacer, expr)
-
-    def _evaluate_expression(self, expr: str) -> bool:
-        """Evaluate a resolved expression."""
-        # Handle 'not in' (must check before 'in')
-        if ' not in ' in expr:
-            parts = expr.split(' not in ', 1)
-            if len(parts) == 2:
-                left = self._parse_value(parts[0].strip())
-                right = self._parse_list(parts[1].strip())
-                return left not in right
-
-        # Handle 'in'
-        if ' in ' in expr:
-            parts = expr.split(' in ', 1)
-            if len(parts) == 2:
-                left = self._parse_value(parts[0].strip())
-                right = self._parse_list(parts[1].strip())
-                return left in right
-
-        # Handle '!='
-        if ' != ' in expr:
-            parts = expr.split(' != ', 1)
-            if len(parts) == 2:
-                left = self._parse_value(parts[0].strip())
-                right = self._parse_value(parts[1].strip())
-                return left != right
-
-        # Handle '=='
-        if ' == ' in expr:
-            parts = expr.split(' == ', 1)
-            if len(parts) == 2:
-                left = self._parse_value(parts[0].strip())
-                right = self._parse_value(parts[1].strip())
-                return left == right
-
-        # Unknown expression format
-        raise ValueError(f"Invalid when expression: {expr}")
-
-    def _parse_value(self, s: str) -> str:
-        """Parse a single value (string literal or bare word)."""
-        s = s.strip()
-        # Try to parse as Python literal (handles quoted strings)
-        try:
-            return ast.literal_eval(s)
-        except (ValueError, SyntaxError):
-            # Return as-is (bare word)
-            return s
-
-    def _parse_list(self, s: str) -> List[str]:
-        """Parse a list literal like ['a', 'b', 'c']."""
-        s = s.strip()
-        try:
-            result = ast.literal_eval(s)
-            if isinstance(result, (list, tuple, set)):
-                return list(result)
-            # Single value - wrap in list
-            return [result]
-        except (ValueError, SyntaxError):
-            raise ValueError(f"Invalid list syntax: {s}")
+        return bool(_compile_when(expression.strip())(self.context))
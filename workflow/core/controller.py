@@ -28,6 +28,8 @@ class WorkflowController:
             
         # Initialize Engine with Context
         self.context = WorkflowContext(initial_data=self.config.variables)
+        # Lets plugins (e.g. batch validators) read the config that was loaded
+        self.context.update("config_path", os.path.abspath(config_path))
         self.engine = WorkflowEngine(self.config, self.context)
         self.audit = WorkflowAuditManager(audit_dir=self.config.audit_dir)
         
@@ -1380,7 +1382,9 @@ class WorkflowController:
         """Create a new parallel track."""
         # Default stage: first stage in config
         if not stage:
-            stage = list(self.config.stages.keys())[0]
+            stage = next(iter(self.config.stages), None)
+            if stage is None:
+                raise ValueError("No stages configured.")
         # Validate track_id format
         if not re.match(r'^[A-Za-z0-9_-]+$', track_id):
             return t('controller.track.invalid_id', id=track_id)
@@ -1,6 +1,14 @@
+import copy
+import functools
 import re
 import yaml
 from typing import List, Optional, Dict, Any
+
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from .state import CheckItem
 from .schema import WorkflowConfigV2, StageConfig, TransitionConfig, ConditionConfig, ChecklistItemConfig, RalphConfig, FileCheckConfig, PlatformActionConfig, PhaseCycleConfig
 
@@ -63,9 +71,16 @@ class GuideParser:
 class ConfigParserV2:
     @staticmethod
     def load(path: str) -> WorkflowConfigV2:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        
+        with open(path, 'rb') as f:
+            raw = f.read()
+        # Callers may mutate the config, so never hand out the cached instance
+        return copy.deepcopy(ConfigParserV2._load_from_bytes(raw))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _load_from_bytes(raw: bytes) -> WorkflowConfigV2:
+        data = yaml.load(raw.decode('utf-8'), Loader=_YamlLoader)
+
         # Parse rulesets
         rulesets = {}
         for rs_name, rs_data in data.get('rulesets', {}).items():
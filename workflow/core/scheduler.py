@@ -64,10 +64,20 @@ class PhaseScheduler:
             raise ValueError(
                 f"Phase '{phase_id}' status is '{node.status}', expected 'active'"
             )
-        before = {n.id for n in PhaseScheduler.get_available(graph)}
         node.status = "complete"
-        after = PhaseScheduler.get_available(graph)
-        return [n for n in after if n.id not in before]
+        # Only direct dependents of phase_id can have become available
+        unlocked = [
+            n for n in graph.values()
+            if n.status == "pending"
+            and phase_id in n.depends_on
+            and all(
+                graph[dep].status == "complete"
+                for dep in n.depends_on
+                if dep in graph
+            )
+        ]
+        unlocked.sort(key=lambda n: n.id)
+        return unlocked
 
     @staticmethod
     def is_all_complete(graph: Dict[str, PhaseNode]) -> bool:
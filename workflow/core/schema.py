@@ -61,7 +61,7 @@ class ChecklistItemConfig:
     allowed_exit_codes: List[int] = field(default_factory=lambda: [0])  # Exit codes considered success
     ralph: Optional[RalphConfig] = None  # Ralph Loop configuration
 
-@dataclass
+@dataclass(slots=True)
 class PhaseCycleConfig:
     """Phase 사이클 경계 선언. DAG auto-transition의 전제 조건."""
     start: str   # Phase 사이클 시작 stage ID (예: "P1")
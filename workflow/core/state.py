@@ -1,8 +1,9 @@
 import json
 import os
+import sys
 import tempfile
 import time
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from contextlib import contextmanager
 
@@ -13,6 +14,13 @@ try:
 except ImportError:
     HAS_FCNTL = False  # Windows
 
+# Fast JSON encoding - optional
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 @contextmanager
 def file_lock(filepath: str, timeout: float = 5.0):
@@ -44,7 +52,20 @@ def file_lock(filepath: str, timeout: float = 5.0):
                 raise TimeoutError(f"Could not acquire lock for {filepath} within {timeout}s")
             time.sleep(0.1)
 
-@dataclass
+def _nested_to_dict(obj):
+    """json default= hook: encode nested state dataclasses as they are reached."""
+    if isinstance(obj, (CheckItem, PhaseNode, TrackState)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _intern(value):
+    """Intern strings read from JSON so stage/status comparisons can
+    short-circuit on identity."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class CheckItem:
     text: str
     checked: bool = False
@@ -53,7 +74,31 @@ class CheckItem:
     action: Optional[str] = None  # Shell command to execute on check
     require_args: bool = False    # Whether action requires --args
 
-@dataclass
+    def to_dict(self) -> Dict:
+        return {
+            'text': self.text,
+            'checked': self.checked,
+            'evidence': self.evidence,
+            'required_agent': self.required_agent,
+            'action': self.action,
+            'require_args': self.require_args,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CheckItem':
+        # Positional on purpose: checklists are the longest lists in a state
+        # file, and this skips building a kwargs dict for every item.
+        get = data.get
+        return cls(
+            get('text', ""),
+            get('checked', False),
+            get('evidence'),
+            get('required_agent'),
+            get('action'),
+            get('require_args', False),
+        )
+
+@dataclass(slots=True)
 class PhaseNode:
     """마일스톤 Phase DAG의 노드."""
     id: str
@@ -63,7 +108,13 @@ class PhaseNode:
     status: str = "pending"  # "pending" | "active" | "complete"
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'label': self.label,
+            'module': self.module,
+            'depends_on': list(self.depends_on),
+            'status': self.status,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'PhaseNode':
@@ -72,10 +123,10 @@ class PhaseNode:
             label=data.get('label', ""),
             module=data.get('module', ""),
             depends_on=data.get('depends_on', []),
-            status=data.get('status', "pending")
+            status=_intern(data.get('status', "pending"))
         )
 
-@dataclass
+@dataclass(slots=True)
 class TrackState:
     """Independent parallel track state."""
     current_stage: str = ""
@@ -88,32 +139,34 @@ class TrackState:
     created_by: str = "manual"       # "manual" (v1) | "auto" (v2 DAG scheduler)
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'current_stage': self.current_stage,
+            'active_module': self.active_module,
+            # Auto-created tracks start empty; skip the comprehension then.
+            'checklist': [item.to_dict() for item in self.checklist] if self.checklist else [],
+            'label': self.label,
+            'status': self.status,
+            'created_at': self.created_at,
+            'phase_id': self.phase_id,
+            'created_by': self.created_by,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'TrackState':
-        items = []
-        for item in data.get('checklist', []):
-            items.append(CheckItem(
-                text=item.get('text', ""),
-                checked=item.get('checked', False),
-                evidence=item.get('evidence', None),
-                required_agent=item.get('required_agent', None),
-                action=item.get('action', None),
-                require_args=item.get('require_args', False)
-            ))
+        get = data.get
+        items = get('checklist')
         return cls(
-            current_stage=data.get('current_stage', ""),
-            active_module=data.get('active_module', "unknown"),
-            checklist=items,
-            label=data.get('label', ""),
-            status=data.get('status', "in_progress"),
-            created_at=data.get('created_at', ""),
-            phase_id=data.get('phase_id', None),
-            created_by=data.get('created_by', "manual")
+            current_stage=_intern(get('current_stage', "")),
+            active_module=_intern(get('active_module', "unknown")),
+            checklist=[CheckItem.from_dict(item) for item in items] if items else [],
+            label=get('label', ""),
+            status=_intern(get('status', "in_progress")),
+            created_at=get('created_at', ""),
+            phase_id=get('phase_id'),
+            created_by=get('created_by', "manual")
         )
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowState:
     current_milestone: str = ""
     current_phase: str = ""
@@ -124,47 +177,73 @@ class WorkflowState:
     active_track: Optional[str] = None
     phase_graph: Dict[str, PhaseNode] = field(default_factory=dict)
 
-    def to_dict(self) -> Dict:
-        return asdict(self)
+    def to_dict(self, shallow: bool = False) -> Dict:
+        # Built by hand: dataclasses.asdict deep-copies every field, which
+        # dominates the cost of each save(). With shallow=True nested items
+        # are left as dataclasses for encoders that serialize them natively.
+        if shallow:
+            checklist, tracks = self.checklist, self.tracks
+            phase_graph = self.phase_graph
+        else:
+            checklist = [item.to_dict() for item in self.checklist]
+            tracks = {tid: t.to_dict() for tid, t in self.tracks.items()}
+            phase_graph = {pid: n.to_dict() for pid, n in self.phase_graph.items()}
+        data = {
+            'current_milestone': self.current_milestone,
+            'current_phase': self.current_phase,
+            'current_stage': self.current_stage,
+            'active_module': self.active_module,
+            'checklist': checklist,
+        }
+        # Most states never use parallel tracks; omit the empty v1 keys
+        # (from_dict defaults them when missing).
+        if self.tracks:
+            data['tracks'] = tracks
+        if self.active_track is not None:
+            data['active_track'] = self.active_track
+        data['phase_graph'] = phase_graph
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'WorkflowState':
-        items = []
-        for item in data.get('checklist', []):
-            items.append(CheckItem(
-                text=item.get('text', ""),
-                checked=item.get('checked', False),
-                evidence=item.get('evidence', None),
-                required_agent=item.get('required_agent', None),
-                action=item.get('action', None),
-                require_args=item.get('require_args', False)
-            ))
-
-        tracks = {}
-        for tid, tdata in (data.get('tracks') or {}).items():
-            tracks[tid] = TrackState.from_dict(tdata)
-
-        phase_graph = {}
-        for pid, pdata in (data.get('phase_graph') or {}).items():
-            phase_graph[pid] = PhaseNode.from_dict(pdata)
-
+        get = data.get
+        tracks = get('tracks') or {}
+        phase_graph = get('phase_graph') or {}
         return cls(
-            current_milestone=data.get('current_milestone', ""),
-            current_phase=data.get('current_phase', ""),
-            current_stage=data.get('current_stage', ""),
-            active_module=data.get('active_module', "unknown"),
-            checklist=items,
-            tracks=tracks,
-            active_track=data.get('active_track', None),
-            phase_graph=phase_graph
+            current_milestone=get('current_milestone', ""),
+            current_phase=get('current_phase', ""),
+            current_stage=_intern(get('current_stage', "")),
+            active_module=_intern(get('active_module', "unknown")),
+            checklist=[CheckItem.from_dict(item) for item in get('checklist', ())],
+            tracks={tid: TrackState.from_dict(t) for tid, t in tracks.items()},
+            active_track=get('active_track'),
+            phase_graph={pid: PhaseNode.from_dict(p) for pid, p in phase_graph.items()}
         )
 
+    def dumps(self) -> bytes:
+        """Serialize state to indented UTF-8 JSON in a single buffer."""
+        if HAS_ORJSON:
+            # orjson walks the nested dataclasses in C, so only the top level
+            # is built as a dict; no per-item dicts are allocated.
+            return orjson.dumps(self.to_dict(shallow=True), option=orjson.OPT_INDENT_2)
+        return json.dumps(self.to_dict(shallow=True), indent=2, ensure_ascii=False,
+                          default=_nested_to_dict).encode('utf-8')
+
+    @classmethod
+    def loads(cls, raw: bytes) -> 'WorkflowState':
+        """Parse state from JSON bytes; the counterpart of dumps()."""
+        if HAS_ORJSON:
+            return cls.from_dict(orjson.loads(raw))  # orjson.JSONDecodeError subclasses json's
+        return cls.from_dict(json.loads(raw))
+
     def save(self, path: str):
         """Save state with file locking and atomic write."""
         parent_dir = os.path.dirname(path)
         if parent_dir:
             os.makedirs(parent_dir, exist_ok=True)
 
+        # Serialize up front so the lock only covers the write and rename.
+        payload = self.dumps()
         try:
             with file_lock(path):
                 # Atomic write: write to temp file, then rename
@@ -174,8 +253,8 @@ class WorkflowState:
                     suffix='.tmp'
                 )
                 try:
-                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                        json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(payload)
                     # Atomic rename (on POSIX systems)
                     os.replace(temp_path, path)
                 except Exception:
@@ -187,8 +266,8 @@ class WorkflowState:
                     raise
         except TimeoutError:
             # Fallback to direct write if lock times out
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+            with open(path, 'wb') as f:
+                f.write(payload)
 
     @classmethod
     def load(cls, path: str) -> 'WorkflowState':
@@ -198,8 +277,7 @@ class WorkflowState:
 
         try:
             with file_lock(path):
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return cls.from_dict(data)
+                with open(path, 'rb') as f:
+                    return cls.loads(f.read())
         except (json.JSONDecodeError, TimeoutError):
             return cls()
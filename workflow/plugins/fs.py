@@ -13,11 +13,13 @@ class FileExistsValidator(BaseValidator):
             root = context.get('project_root', os.getcwd())
             path = os.path.join(root, path)
             
-        exists = os.path.exists(path)
-        # print(f"DEBUG: Checking path '{path}' -> {exists}") # Temporary debug
-        
-        check_not_empty = args.get('not_empty', False)
-        if exists and check_not_empty:
-            return os.path.getsize(path) > 0
-            
-        return exists
+        # One stat answers both "exists" and "not empty"
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return False
+
+        if args.get('not_empty', False):
+            return st.st_size > 0
+
+        return True
@@ -5,6 +5,10 @@ from ..core.validator import BaseValidator
 from ..core.context import ContextResolver
 
 class CommandValidator(BaseValidator):
+    def __init__(self, runner=subprocess.run):
+        # Injectable so tests can check argument handling without spawning a shell
+        self._runner = runner
+
     def validate(self, args: Dict[str, Any], context: Dict[str, Any]) -> bool:
         cmd = args.get('cmd')
         if not cmd:
@@ -23,7 +27,7 @@ class CommandValidator(BaseValidator):
             env = os.environ.copy()
 
             # Run command silently
-            result = subprocess.run(
+            result = self._runner(
                 cmd,
                 shell=True,
                 stdout=subprocess.DEVNULL,